@@ -19,26 +19,342 @@ DEST_ARTIFACTORY_PASSWORD : str
     Password for destination Artifactory server.
 """
 
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import random
 import shutil
+import socket
 import subprocess
 import sys
+import tarfile
 import tempfile
+import threading
 import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, as_completed, wait
+from collections.abc import Callable, Iterable, Iterator, Sized
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from urllib.parse import urlparse
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+import urllib3
 from tqdm import tqdm
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry
+
+try:
+    # Optional: parses large listing responses several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional: parses deep listings incrementally instead of all at once
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Number of concurrent transfers; the workload is network-bound, so threads
+# overlap request latency rather than compete for CPU.
+DEFAULT_MAX_WORKERS = 16
+
+# Tasks queued per worker ahead of the running ones; bounds memory when a
+# listing holds millions of files while keeping every worker busy.
+PENDING_PER_WORKER = 2
+
+# Keep-alive connections kept per host; sized above DEFAULT_MAX_WORKERS so
+# concurrent transfers reuse warm connections instead of re-handshaking.
+POOL_SIZE = 64
+
+# Seconds a pooled connection may sit idle before TCP keep-alive probes
+# start, kept below common NAT and firewall idle timeouts.
+TCP_KEEPALIVE_IDLE = 60
+
+# Responses worth retrying: throttling and transient server-side failures
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Bytes handed to the socket per write when uploading. Large blocks amortize
+# the per-call interpreter and syscall overhead of streaming a request body.
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+# Bytes read from the response and written to disk per loop iteration when
+# downloading.
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# Bytes of listing JSON fed to the incremental parser at a time
+LISTING_CHUNK_BYTES = 64 * 1024
+
+# Files smaller than this are always downloaded over a single connection;
+# below it the extra requests cost more than parallel streams gain.
+RANGED_DOWNLOAD_MIN_BYTES = 64 * 1024 * 1024
+
+# Where deep listings and their ETags are cached between runs
+LISTING_CACHE_DIR = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'artifactory-sync'
+
+# Text-like artifact types worth gzip-encoding on upload; archives and
+# images are already compressed and are sent as-is.
+COMPRESSIBLE_SUFFIXES = frozenset({
+    '.json', '.xml', '.yaml', '.yml', '.pom', '.txt', '.properties', '.sh', '.py'
+})
+
+# Files smaller than this are sent uncompressed
+COMPRESS_MIN_BYTES = 4096
+
+# Files smaller than this are uploaded directly; for them a checksum deploy
+# attempt costs about as much as the upload it might save.
+CHECKSUM_DEPLOY_MIN_BYTES = 64 * 1024
+
+# With batch uploads, files below CHECKSUM_DEPLOY_MIN_BYTES are deployed in
+# tar archives the server explodes, up to this many files per archive
+# (at most 64 MiB). Fewer than BATCH_MIN_FILES are uploaded one by one.
+BATCH_MAX_FILES = 1000
+BATCH_MIN_FILES = 50
+
+# Results requested per AQL query; listings are fetched page by page
+AQL_PAGE_SIZE = 1000
+
+# Archives up to this size are built in memory, larger ones in a temp file
+ARCHIVE_SPOOL_BYTES = 16 * 1024 * 1024
+
+
+def _iter_json_items(response: requests.Response, prefix: str) -> Iterator:
+    """Yield the items under ``prefix`` of a streamed JSON response.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response opened with ``stream=True``; closed once exhausted.
+    prefix : str
+        ijson prefix of the items to yield, e.g. ``files.item``.
+
+    Yields
+    ------
+    object
+        Parsed item.
+
+    Raises
+    ------
+    requests.exceptions.InvalidJSONError
+        If the response is not valid JSON.
+    """
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, prefix, use_float=True)
+    with response:
+        try:
+            for chunk in response.iter_content(chunk_size=LISTING_CHUNK_BYTES):
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            parser.close()
+        except ijson.JSONError as e:
+            raise requests.exceptions.InvalidJSONError(f'Invalid JSON response: {e}') from e
+    yield from items
+
+
+class _SpooledListing:
+    """File listing read to the end into a temporary file.
+
+    Iterating a streamed listing while transfers run would keep its
+    response open for the whole run, read only as fast as transfers
+    complete, and proxies with idle or send timeouts cut such connections
+    off. Spooling the listing to disk first releases the connection
+    quickly while keeping memory flat. The listing can be iterated more
+    than once.
+    """
+    
+    def __init__(self, items: Iterable[dict]):
+        self._file = tempfile.TemporaryFile()
+        self._count = 0
+        try:
+            for item in items:
+                self._file.write(json.dumps(item).encode() + b'\n')
+                self._count += 1
+        except BaseException:
+            self._file.close()
+            raise
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self):
+        self._file.seek(0)
+        for line in self._file:
+            yield json_loads(line)
+
+
+def _discard(fileobj) -> None:
+    """Close and delete a partially written temporary file.
+
+    Parameters
+    ----------
+    fileobj : file object or None
+        Temporary file created with ``delete=False``; ignored if None.
+    """
+    if fileobj is not None:
+        fileobj.close()
+        Path(fileobj.name).unlink(missing_ok=True)
+
+
+def _advise_sequential(fileobj) -> None:
+    """Hint the kernel that a file will be read once from start to end.
+
+    Enables aggressive read-ahead on platforms with ``posix_fadvise``; a
+    no-op elsewhere or if the file system rejects the hint.
+
+    Parameters
+    ----------
+    fileobj : file object
+        Open file to advise on.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Return socket options enabling TCP keep-alive probes.
+
+    Options the platform does not support are left out.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        urllib3's default options (``TCP_NODELAY``) plus keep-alive.
+    """
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (
+        ('TCP_KEEPIDLE', TCP_KEEPALIVE_IDLE),
+        ('TCP_KEEPALIVE', TCP_KEEPALIVE_IDLE),  # macOS name for TCP_KEEPIDLE
+        ('TCP_KEEPINTVL', 10),
+        ('TCP_KEEPCNT', 6)
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send TCP keep-alive probes.
+
+    Pooled connections idle during long listings or between bursts of
+    transfers would otherwise be dropped silently by middleboxes, and the
+    next request on them fails or has to reconnect.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', _keepalive_socket_options())
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _RangeIgnoredError(requests.exceptions.RequestException):
+    """The server answered a range request with the whole file."""
+
+
+class _SizedStream:
+    """Iterable request body with a known length.
+
+    requests sends a ``Content-Length`` header for bodies that define
+    ``__len__`` and writes them chunk by chunk, instead of falling back to
+    chunked transfer-encoding as it does for plain generators. Seekable
+    sources are rewound on each iteration so a retried request resends the
+    whole body; unseekable ones can only be sent once.
+    """
+    
+    def __init__(self, fileobj, length: int, chunk_size: int = UPLOAD_CHUNK_BYTES):
+        self.fileobj = fileobj
+        self.length = length
+        self.chunk_size = chunk_size
+        self._start = fileobj.tell() if fileobj.seekable() else None
+        self._consumed = False
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __iter__(self):
+        if self._start is not None:
+            self.fileobj.seek(self._start)
+        elif self._consumed:
+            raise requests.exceptions.StreamConsumedError('Request body cannot be replayed')
+        self._consumed = True
+        while True:
+            chunk = self.fileobj.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class _OneShotStream:
+    """Iterable request body that can only be sent once.
+
+    Wraps a generator so a retried request fails instead of silently
+    resending the exhausted generator as an empty body.
+    """
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = chunks
+        self._consumed = False
+    
+    def __iter__(self):
+        if self._consumed:
+            raise requests.exceptions.StreamConsumedError('Request body cannot be replayed')
+        self._consumed = True
+        yield from self.chunks
+
+
+class _GzipStream:
+    """Iterable request body that gzip-compresses a file while it is sent.
+
+    The compressed length is not known up front, so requests sends it with
+    chunked transfer-encoding. The file is rewound and a fresh compressor
+    used on each iteration so a retried request resends the whole body.
+    """
+    
+    def __init__(self, fileobj, chunk_size: int = UPLOAD_CHUNK_BYTES):
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        self._start = fileobj.tell()
+    
+    def __iter__(self):
+        self.fileobj.seek(self._start)
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+        while True:
+            chunk = self.fileobj.read(self.chunk_size)
+            if not chunk:
+                break
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
 
 
 class ArtifactoryClient:
     """Client for interacting with Artifactory API."""
     
-    def __init__(self, base_url: str, username: str, password: str, retries: int = 3):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        retries: int = 3,
+        cache_dir: Path | None = None,
+        compress_uploads: bool = False,
+        adapter: HTTPAdapter | None = None,
+        pool_size: int = POOL_SIZE,
+        use_aql: bool = False,
+        download_streams: int = 1
+    ):
         """Initialize Artifactory client.
 
         Parameters
@@ -52,14 +368,80 @@ class ArtifactoryClient:
             Artifactory password.
         retries : int, optional
             Number of retry attempts for failed requests. Default is 3.
+        cache_dir : Path, optional
+            Directory for caching deep listings by ETag. Caching is
+            disabled if not provided.
+        compress_uploads : bool, optional
+            If True, upload text-like files with ``Content-Encoding: gzip``.
+            Default is False.
+        adapter : HTTPAdapter, optional
+            Transport adapter holding the connection pool. Pass the same
+            adapter to clients of one server so they share keep-alive
+            connections. A new one is created if not provided.
+        pool_size : int, optional
+            Keep-alive connections kept per host when the adapter is created
+            here; match it to the number of concurrent transfers. Default is
+            POOL_SIZE.
+        use_aql : bool, optional
+            If True, ``list_files`` lists subtrees with AQL instead of the
+            File List API. Default is False.
+        download_streams : int, optional
+            Number of concurrent range requests used to download a file of
+            RANGED_DOWNLOAD_MIN_BYTES or more whose size is known. Default
+            is 1, which downloads every file over a single connection.
         """
         self._validate_url(base_url)
         self.base_url = base_url.rstrip('/')
         self.auth = HTTPBasicAuth(username, password)
         self.session = requests.Session()
         self.session.auth = self.auth
+        self.session.headers['Connection'] = 'keep-alive'
+        adapter = adapter or self.create_adapter(retries, pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.timeout = 30  # Request timeout in seconds
         self.retries = retries
+        self._repo_urls: dict[str, str] = {}
+        self.cache_dir = cache_dir
+        self.compress_uploads = compress_uploads
+        self.use_aql = use_aql
+        self.download_streams = download_streams
+    
+    @staticmethod
+    def create_adapter(retries: int = 3, pool_size: int = POOL_SIZE) -> HTTPAdapter:
+        """Create a transport adapter with a keep-alive connection pool.
+
+        Connections send TCP keep-alive probes while idle. Failed
+        connections and throttling or server errors are retried by urllib3
+        with jittered exponential backoff, honoring ``Retry-After``.
+
+        Parameters
+        ----------
+        retries : int, optional
+            Number of retry attempts for failed requests. Default is 3.
+        pool_size : int, optional
+            Keep-alive connections kept per host. Default is POOL_SIZE.
+
+        Returns
+        -------
+        HTTPAdapter
+            Adapter keeping up to ``pool_size`` connections per host.
+        """
+        retry = Retry(
+            total=retries,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=['HEAD', 'GET', 'PUT', 'POST'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+            pool_block=False
+        )
     
     @staticmethod
     def _validate_url(url: str) -> None:
@@ -82,52 +464,928 @@ class ArtifactoryClient:
         except Exception as e:
             raise ValueError(f"Invalid URL format: {url}") from e
     
-    def _retry_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Execute request with exponential backoff retry.
+    def _repo_base(self, repo: str) -> str:
+        """Return the base URL of a repository, built once per repository.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+
+        Returns
+        -------
+        str
+            Repository URL without trailing slash.
+        """
+        url = self._repo_urls.get(repo)
+        if url is None:
+            url = self._repo_urls[repo] = f'{self.base_url}/{repo}'
+        return url
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close session."""
+        self.session.close()
+        return False
+    
+    def list_artifacts(self, repo: str, path: str = '', verbose: bool = False) -> list[dict]:
+        """List artifacts in a repository path.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        path : str, optional
+            Path within repository. Defaults to root if empty.
+        verbose : bool, optional
+            Enable verbose logging. Default is False.
+
+        Returns
+        -------
+        list[dict]
+            List of artifact metadata dictionaries from Artifactory API.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If API request fails.
+        """
+        path = path.lstrip('/')
+        url = f'{self.base_url}/api/repository/{repo}'
+        if path:
+            url = f'{url}/{path}'
+        
+        try:
+            if verbose:
+                click.echo(f'[LIST] Querying repository: {url}')
+            
+            response = self.session.request(
+                'GET',
+                url,
+                params={'list': '1', 'deep': '1', 'listFolders': '1'},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = json_loads(response.content)
+            results = data.get('results', [])
+            
+            if verbose:
+                click.echo(f'[LIST] Found {len(results)} items')
+            
+            return results
+        except requests.exceptions.RequestException as e:
+            click.echo(f'[ERROR] Error listing artifacts: {e}', err=True)
+            raise
+    
+    def list_artifacts_deep(self, repo: str, path: str = '', verbose: bool = False) -> Iterable[dict]:
+        """List every file below a repository path in a single request.
+
+        Uses the File List API with ``deep=1`` so the whole subtree is
+        returned at once instead of issuing one listing per folder. When
+        ijson is installed the response is parsed incrementally, so files
+        are yielded while the listing is still arriving and the full
+        document is never held in memory.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        path : str, optional
+            Path within repository. Defaults to root if empty.
+        verbose : bool, optional
+            Enable verbose logging. Default is False.
+
+        Returns
+        -------
+        Iterable[dict]
+            File metadata dictionaries, to be iterated once. Each ``uri``
+            is relative to ``path`` and starts with ``/``.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If API request fails.
+        """
+        path = path.strip('/')
+        url = f'{self.base_url}/api/storage/{repo}'
+        if path:
+            url = f'{url}/{path}'
+        
+        try:
+            if verbose:
+                click.echo(f'[LIST] Querying file list: {url}')
+            
+            cache_file = self._listing_cache_file(repo, path) if self.cache_dir else None
+            cached = self._load_listing_cache(cache_file) if cache_file else None
+            headers = {'If-None-Match': cached['etag']} if cached else {}
+            
+            response = self.session.request(
+                'GET',
+                url,
+                params={'list': '1', 'deep': '1', 'listFolders': '0', 'mdTimestamps': '0'},
+                headers=headers,
+                stream=ijson is not None,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            if response.status_code == 304:
+                response.close()
+                files = cached['files']
+                if verbose:
+                    click.echo(f'[LIST] Listing unchanged, using cache: {cache_file}')
+            elif ijson is not None:
+                if verbose:
+                    click.echo('[LIST] Streaming file list')
+                return self._stream_listing(response, cache_file)
+            else:
+                files = json_loads(response.content).get('files', [])
+                etag = response.headers.get('ETag')
+                if cache_file and etag:
+                    self._save_listing_cache(cache_file, etag, files)
+            
+            if verbose:
+                click.echo(f'[LIST] Found {len(files)} files')
+            
+            return files
+        except requests.exceptions.RequestException as e:
+            click.echo(f'[ERROR] Error listing artifacts: {e}', err=True)
+            raise
+    
+    def _listing_cache_file(self, repo: str, path: str) -> Path:
+        """Return the cache file for a deep listing.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        path : str
+            Normalized path within repository.
+
+        Returns
+        -------
+        Path
+            Cache file keyed by server, repository and path.
+        """
+        netloc = urlparse(self.base_url).netloc
+        digest = hashlib.sha256(f'{self.base_url}/{repo}/{path}'.encode()).hexdigest()[:16]
+        return self.cache_dir / f'{netloc.replace(":", "_")}_{repo}_{digest}.json'
+    
+    @staticmethod
+    def _load_listing_cache(cache_file: Path) -> dict | None:
+        """Load a cached listing.
+
+        Parameters
+        ----------
+        cache_file : Path
+            Cache file to read.
+
+        Returns
+        -------
+        dict or None
+            Dictionary with ``etag`` and ``files`` keys, or None if the
+            cache is missing or unreadable.
+        """
+        try:
+            cached = json_loads(cache_file.read_bytes())
+            if 'etag' in cached and 'files' in cached:
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    @staticmethod
+    def _stream_listing(response: requests.Response, cache_file: Path | None) -> Iterator[dict]:
+        """Incrementally parse a File List response.
+
+        Files are yielded as soon as they are parsed. If the response has an
+        ETag they are also written to the cache as they go by; the cache
+        file is only replaced once the whole listing has been read.
+
+        Parameters
+        ----------
+        response : requests.Response
+            Streamed File List response.
+        cache_file : Path or None
+            Cache file to write, or None to skip caching.
+
+        Yields
+        ------
+        dict
+            File metadata dictionary.
+
+        Raises
+        ------
+        requests.exceptions.InvalidJSONError
+            If the listing is not valid JSON.
+        """
+        etag = response.headers.get('ETag')
+        cache = None
+        separator = ''
+        try:
+            if cache_file and etag:
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    cache = tempfile.NamedTemporaryFile(
+                        'w', dir=cache_file.parent, suffix='.tmp', delete=False
+                    )
+                    cache.write(f'{{"etag": {json.dumps(etag)}, "files": [')
+                except OSError as e:
+                    logger.debug('[LIST] Could not write listing cache %s: %s', cache_file, e)
+                    cache = _discard(cache)
+            
+            for item in _iter_json_items(response, 'files.item'):
+                if cache:
+                    try:
+                        cache.write(separator + json.dumps(item))
+                        separator = ', '
+                    except OSError as e:
+                        logger.debug('[LIST] Could not write listing cache %s: %s', cache_file, e)
+                        cache = _discard(cache)
+                yield item
+            
+            if cache:
+                try:
+                    cache.write(']}')
+                    cache.close()
+                    os.replace(cache.name, cache_file)
+                    cache = None
+                except OSError as e:
+                    logger.debug('[LIST] Could not write listing cache %s: %s', cache_file, e)
+        finally:
+            _discard(cache)
+    
+    @staticmethod
+    def _save_listing_cache(cache_file: Path, etag: str, files: list[dict]) -> None:
+        """Atomically write a listing and its ETag to the cache.
+
+        Parameters
+        ----------
+        cache_file : Path
+            Cache file to write.
+        etag : str
+            ETag returned with the listing.
+        files : list[dict]
+            Listing to cache.
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=cache_file.parent, suffix='.tmp', delete=False
+            ) as f:
+                f.write(json.dumps({'etag': etag, 'files': files}))
+            os.replace(f.name, cache_file)
+        except OSError as e:
+            logger.debug('[LIST] Could not write listing cache %s: %s', cache_file, e)
+    
+    def stat(self, repo: str, artifact_path: str) -> dict | None:
+        """Fetch the metadata of a single artifact.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        artifact_path : str
+            Path to artifact in repository, without a leading ``/``.
+
+        Returns
+        -------
+        dict or None
+            File info including ``checksums``, or None if the artifact does
+            not exist.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If API request fails for another reason.
+        """
+        response = self.session.get(
+            f'{self.base_url}/api/storage/{repo}/{artifact_path}', timeout=self.timeout
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    def deploy_by_checksum(self, repo: str, artifact_path: str, sha256: str) -> bool:
+        """Deploy an artifact from a binary the server already stores.
+
+        Sends a bodiless PUT with ``X-Checksum-Deploy: true``, so no content
+        is transferred when a file with the same SHA-256 exists anywhere on
+        the server.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        artifact_path : str
+            Target path in repository, without a leading ``/``.
+        sha256 : str
+            SHA-256 checksum of the artifact.
+
+        Returns
+        -------
+        bool
+            True if deployed, False if the server does not have the binary
+            or the request failed; the caller should then upload it.
+        """
+        url = f'{self._repo_base(repo)}/{artifact_path}'
+        try:
+            response = self.session.put(
+                url,
+                headers={'X-Checksum-Deploy': 'true', 'X-Checksum-Sha256': sha256},
+                timeout=self.timeout
+            )
+            response.close()
+            if response.ok:
+                logger.debug('[UPLOAD] Deployed by checksum: %s', artifact_path)
+            return response.ok
+        except requests.exceptions.RequestException:
+            return False
+    
+    def download_file(
+        self,
+        repo: str,
+        artifact_path: str,
+        local_path: Path,
+        size: int | None = None
+    ) -> str | None:
+        """Download a single artifact from Artifactory.
+
+        The file is hashed while it is written, and the digest is returned
+        so it can be handed to ``upload_file`` without reading the file again.
+        Large files are fetched with parallel range requests when
+        ``download_streams`` is above 1 and their size is given.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        artifact_path : str
+            Path to artifact in repository, without a leading ``/``.
+        local_path : Path
+            Local path to save downloaded file.
+        size : int, optional
+            Size of the artifact in bytes, e.g. from the listing.
+
+        Returns
+        -------
+        str or None
+            SHA-256 hex digest of the downloaded file, or None if the
+            download failed or did not match the server checksum.
+        """
+        url = f'{self._repo_base(repo)}/{artifact_path}' if artifact_path else self._repo_base(repo)
+        
+        try:
+            logger.debug('[DOWNLOAD] Fetching from: %s', url)
+            
+            if (
+                self.download_streams > 1
+                and size is not None
+                and size >= RANGED_DOWNLOAD_MIN_BYTES
+                and hasattr(os, 'pwrite')
+            ):
+                try:
+                    return self._download_ranged(url, artifact_path, local_path, size)
+                except _RangeIgnoredError:
+                    # The server does not serve ranges; stop trying them
+                    self.download_streams = 1
+                    logger.debug('[DOWNLOAD] Range requests not supported, using one stream: %s', url)
+            
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                
+                # Create parent directories if needed
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                logger.debug('[DOWNLOAD] File size: %s bytes', response.headers.get('content-length', 'unknown'))
+                
+                # Copy straight from the socket in large blocks, hashing on the
+                # fly to avoid re-reading the file
+                response.raw.decode_content = True
+                digest = hashlib.sha256()
+                with open(local_path, 'wb', buffering=DOWNLOAD_CHUNK_BYTES) as f:
+                    while chunk := response.raw.read(DOWNLOAD_CHUNK_BYTES):
+                        f.write(chunk)
+                        digest.update(chunk)
+                    bytes_written = f.tell()
+                
+                if not self._checksum_matches(
+                    artifact_path, local_path, response.headers.get('X-Checksum-Sha256'), digest.hexdigest()
+                ):
+                    return None
+            
+            logger.debug('[DOWNLOAD] Successfully saved to: %s (%d bytes)', local_path, bytes_written)
+            
+            return digest.hexdigest()
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Never leave a partial file behind for a later upload to pick up
+            local_path.unlink(missing_ok=True)
+            click.echo(f'[ERROR] Error downloading {artifact_path}: {e}', err=True)
+            return None
+    
+    def _download_ranged(self, url: str, artifact_path: str, local_path: Path, size: int) -> str | None:
+        """Download a file as concurrent byte ranges written at their offsets.
+
+        A single TCP stream often cannot fill a fast long-distance link;
+        several range requests in parallel can. The file is preallocated,
+        so it is deleted whenever no digest is returned.
 
         Parameters
         ----------
-        method : str
-            HTTP method (GET, PUT, etc.).
         url : str
-            Request URL.
-        **kwargs
-            Additional arguments to pass to requests.
+            Artifact URL.
+        artifact_path : str
+            Path to artifact in repository, for messages.
+        local_path : Path
+            Local path to save downloaded file.
+        size : int
+            Size of the artifact in bytes.
 
         Returns
         -------
-        requests.Response
-            Response object.
+        str or None
+            SHA-256 hex digest of the downloaded file, or None if it did not
+            match the server checksum.
+
+        Raises
+        ------
+        _RangeIgnoredError
+            If the server ignores the range and sends the whole file.
+        requests.exceptions.RequestException
+            If a range request fails.
+        """
+        part = -(-size // self.download_streams)
+        ranges = [(start, min(start + part, size) - 1) for start in range(0, size, part)]
+        logger.debug('[DOWNLOAD] Fetching %d bytes as %d ranges', size, len(ranges))
+        
+        def fetch(start: int, end: int) -> str | None:
+            with self.session.get(
+                url,
+                stream=True,
+                headers={'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'},
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangeIgnoredError(f'Server ignored range request for {artifact_path}')
+                offset = start
+                while chunk := response.raw.read(DOWNLOAD_CHUNK_BYTES):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                if offset != end + 1:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f'Range {start}-{end} of {artifact_path} ended at {offset}'
+                    )
+                return response.headers.get('X-Checksum-Sha256')
+        
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                checksums = list(executor.map(lambda r: fetch(*r), ranges))
+        except BaseException:
+            # The preallocated file is full size but partly zeros
+            os.close(fd)
+            local_path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+        
+        # Ranges arrive out of order, so the file is hashed once complete
+        with open(local_path, 'rb') as f:
+            _advise_sequential(f)
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        if not self._checksum_matches(artifact_path, local_path, checksums[0], digest):
+            return None
+        
+        logger.debug('[DOWNLOAD] Successfully saved to: %s (%d bytes)', local_path, size)
+        
+        return digest
+    
+    @staticmethod
+    def _checksum_matches(artifact_path: str, local_path: Path, expected: str | None, actual: str) -> bool:
+        """Check a downloaded file against the server checksum.
+
+        The file is deleted if the checksums differ.
+
+        Parameters
+        ----------
+        artifact_path : str
+            Path to artifact in repository, for messages.
+        local_path : Path
+            Downloaded file.
+        expected : str or None
+            SHA-256 sent by the server; the check passes if None.
+        actual : str
+            SHA-256 of the downloaded file.
+
+        Returns
+        -------
+        bool
+            True if the checksums match or none was sent.
+        """
+        if expected and actual != expected.lower():
+            local_path.unlink(missing_ok=True)
+            click.echo(
+                f'[ERROR] Checksum mismatch for {artifact_path}: expected {expected}, got {actual}',
+                err=True
+            )
+            return False
+        return True
+    
+    def upload_file(
+        self,
+        repo: str,
+        artifact_path: str,
+        local_path: Path,
+        dry_run: bool = False,
+        sha256: str | None = None,
+        size: int | None = None
+    ) -> bool:
+        """Upload a file to Artifactory.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        artifact_path : str
+            Target path in repository, without a leading ``/``.
+        local_path : Path
+            Local file path to upload.
+        dry_run : bool, optional
+            If True, simulate upload without actually uploading.
+            Default is False.
+        sha256 : str, optional
+            SHA-256 hex digest of the file, e.g. from ``download_file``.
+            Computed from the file if not provided.
+        size : int, optional
+            Size of the file in bytes, e.g. from a cached ``os.DirEntry``
+            stat. Read from the file system if not provided.
+
+        Returns
+        -------
+        bool
+            True if upload successful or would be successful in dry run,
+            False otherwise.
+        """
+        url = f'{self._repo_base(repo)}/{artifact_path}' if artifact_path else self._repo_base(repo)
+        
+        try:
+            file_size = size if size is not None else local_path.stat().st_size
+            if dry_run:
+                click.echo(f'[DRY-RUN] Would upload to: {url} ({file_size} bytes)')
+                logger.debug('[DRY-RUN] Source file: %s', local_path)
+                return True
+            
+            logger.debug('[UPLOAD] Uploading to: %s (%d bytes)', url, file_size)
+            
+            compress = (
+                self.compress_uploads
+                and file_size > COMPRESS_MIN_BYTES
+                and local_path.suffix.lower() in COMPRESSIBLE_SUFFIXES
+            )
+            
+            with open(local_path, 'rb', buffering=UPLOAD_CHUNK_BYTES) as f:
+                _advise_sequential(f)
+                # Lets Artifactory verify the upload and dedupe identical binaries
+                if sha256 is None:
+                    sha256 = hashlib.file_digest(f, 'sha256').hexdigest()
+                    f.seek(0)
+                if file_size >= CHECKSUM_DEPLOY_MIN_BYTES and self.deploy_by_checksum(
+                    repo, artifact_path, sha256
+                ):
+                    return True
+                
+                headers = {'Content-Type': 'application/octet-stream', 'X-Checksum-Sha256': sha256}
+                
+                if compress:
+                    logger.debug('[UPLOAD] Compressing with gzip: %s', artifact_path)
+                    headers['Content-Encoding'] = 'gzip'
+                    body = _GzipStream(f)
+                else:
+                    # Sized body, so requests sends Content-Length instead of chunking
+                    body = _SizedStream(f, file_size) if file_size else b''
+                response = self.session.put(url, data=body, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+            
+            logger.debug('[UPLOAD] Successfully uploaded: %s', artifact_path)
+            
+            return True
+        except requests.exceptions.RequestException as e:
+            click.echo(f'[ERROR] Error uploading {artifact_path}: {e}', err=True)
+            return False
+    
+    def upload_archive(
+        self,
+        repo: str,
+        dest_path: str,
+        files: list[tuple[Path, str]],
+        name: str
+    ) -> bool:
+        """Upload several files as one tar archive exploded by the server.
+
+        Uses the Deploy Artifacts from Archive API with atomic explode, so
+        either all files are deployed or none are.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        dest_path : str
+            Directory in repository the archive is exploded into.
+        files : list[tuple[Path, str]]
+            Local file paths and their paths relative to ``dest_path``.
+        name : str
+            File name of the archive, unique among concurrent uploads.
+
+        Returns
+        -------
+        bool
+            True if the archive was deployed, False otherwise.
+        """
+        archive_path = f'{dest_path}/{name}' if dest_path else name
+        url = f'{self._repo_base(repo)}/{archive_path}'
+        
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_BYTES) as archive:
+                with tarfile.open(fileobj=archive, mode='w') as tar:
+                    for local_path, rel_path in files:
+                        tar.add(local_path, arcname=rel_path, recursive=False)
+                size = archive.tell()
+                archive.seek(0)
+                
+                logger.debug('[UPLOAD] Uploading %d files as archive: %s (%d bytes)', len(files), url, size)
+                
+                headers = {
+                    'Content-Type': 'application/x-tar',
+                    'X-Explode-Archive': 'true',
+                    'X-Explode-Archive-Atomic': 'true'
+                }
+                response = self.session.put(
+                    url, data=_SizedStream(archive, size), headers=headers, timeout=self.timeout
+                )
+                response.raise_for_status()
+            return True
+        except (requests.exceptions.RequestException, tarfile.TarError, OSError) as e:
+            click.echo(f'[ERROR] Error uploading archive {archive_path}: {e}', err=True)
+            return False
+    
+    def pipe_to(
+        self,
+        src_repo: str,
+        src_path: str,
+        dest_client: 'ArtifactoryClient',
+        dest_repo: str,
+        dest_path: str,
+        sha256: str | None = None
+    ) -> bool:
+        """Stream a single artifact from this server to another one.
+
+        The source response body is fed directly into the destination PUT,
+        so the artifact never touches the local disk. The source checksum is
+        forwarded so the destination can verify what it received. If the
+        checksum is already known, a checksum deploy is tried first and the
+        artifact is only downloaded if the destination lacks the binary.
+
+        Parameters
+        ----------
+        src_repo : str
+            Source repository name.
+        src_path : str
+            Path to artifact in source repository, without a leading ``/``.
+        dest_client : ArtifactoryClient
+            Destination ArtifactoryClient instance.
+        dest_repo : str
+            Destination repository name.
+        dest_path : str
+            Target path in destination repository, without a leading ``/``.
+        sha256 : str, optional
+            SHA-256 checksum of the artifact, e.g. from the source listing.
+
+        Returns
+        -------
+        bool
+            True if transfer successful, False otherwise.
+        """
+        src_url = f'{self._repo_base(src_repo)}/{src_path}'
+        dest_url = f'{dest_client._repo_base(dest_repo)}/{dest_path}'
+        
+        if sha256 and dest_client.deploy_by_checksum(dest_repo, dest_path, sha256):
+            return True
+        
+        # The streamed body cannot be replayed, so urllib3 cannot resend the
+        # PUT itself; throttling and transient failures are retried here by
+        # fetching the artifact again.
+        for attempt in range(self.retries + 1):
+            try:
+                self._pipe_once(src_url, dest_client, dest_url)
+                logger.debug('[SYNC] Successfully synced: %s', dest_path)
+                return True
+            except requests.exceptions.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                retryable = status in RETRY_STATUSES or (
+                    status is None
+                    and isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                       requests.exceptions.ChunkedEncodingError))
+                )
+                if not retryable or attempt == self.retries:
+                    click.echo(f'[ERROR] Error syncing {src_path}: {e}', err=True)
+                    return False
+                logger.debug('[SYNC] Retrying %s after: %s', src_path, e)
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+        return False
+    
+    def _pipe_once(self, src_url: str, dest_client: 'ArtifactoryClient', dest_url: str) -> None:
+        """Stream one artifact from ``src_url`` into a PUT to ``dest_url``.
+
+        Parameters
+        ----------
+        src_url : str
+            URL of the artifact on this server.
+        dest_client : ArtifactoryClient
+            Destination ArtifactoryClient instance.
+        dest_url : str
+            URL to deploy the artifact to.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If the download or the upload fails.
+        """
+        logger.debug('[SYNC] Streaming %s -> %s', src_url, dest_url)
+        
+        # Ask for the stored bytes so the body matches Content-Length
+        with self.session.get(
+            src_url,
+            stream=True,
+            headers={'Accept-Encoding': 'identity'},
+            timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            content_length = response.headers.get('Content-Length')
+            if content_length is None:
+                body = _OneShotStream(response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES))
+            elif int(content_length) == 0:
+                body = b''
+            else:
+                body = _SizedStream(response.raw, int(content_length))
+            
+            headers = {'Content-Type': 'application/octet-stream'}
+            checksum = response.headers.get('X-Checksum-Sha256')
+            if checksum:
+                headers['X-Checksum-Sha256'] = checksum
+            
+            put_response = dest_client.session.put(
+                dest_url, data=body, headers=headers, timeout=dest_client.timeout
+            )
+            put_response.raise_for_status()
+    
+    def aql_find(self, repo: str, path: str = '', verbose: bool = False) -> Iterable[dict]:
+        """List every file below a repository path with paged AQL queries.
+
+        Results are requested in pages of AQL_PAGE_SIZE sorted by path, so
+        a server-side cap on the number of results, as applied to non-admin
+        users, cannot silently truncate the listing. The first page is
+        fetched before returning so a rejected query raises here; the rest
+        are fetched while the listing is iterated.
+
+        Parameters
+        ----------
+        repo : str
+            Repository name.
+        path : str, optional
+            Path within repository. Defaults to root if empty.
+        verbose : bool, optional
+            Enable verbose logging. Default is False.
+
+        Returns
+        -------
+        Iterable[dict]
+            File metadata dictionaries in the same shape as
+            ``list_artifacts_deep``, to be iterated once: ``uri`` relative
+            to ``path`` and starting with ``/``, ``size``, ``sha1`` and
+            ``sha2``.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If API request fails.
+        """
+        path = path.strip('/')
+        criteria = {'repo': repo, 'type': 'file'}
+        if path:
+            criteria['$or'] = [{'path': path}, {'path': {'$match': f'{path}/*'}}]
+        # Non-admin users must include repo, path and name
+        query = (
+            f'items.find({json.dumps(criteria)})'
+            '.include("repo","path","name","size","actual_sha1","sha256")'
+            '.sort({"$asc":["path","name"]})'
+        )
+        
+        if verbose:
+            click.echo(f'[AQL] Querying: {query}')
+        
+        return self._iter_aql(query, repo, path, self._aql_page(query, 0), verbose)
+    
+    def _aql_page(self, query: str, offset: int) -> Iterable[dict]:
+        """Run one page of an AQL query.
+
+        Parameters
+        ----------
+        query : str
+            Sorted AQL query without offset and limit.
+        offset : int
+            Number of results to skip.
+
+        Returns
+        -------
+        Iterable[dict]
+            Result items, streamed when ijson is installed.
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            If API request fails.
+        """
+        try:
+            response = self.session.request(
+                'POST',
+                f'{self.base_url}/api/search/aql',
+                data=f'{query}.offset({offset}).limit({AQL_PAGE_SIZE})',
+                headers={'Content-Type': 'text/plain'},
+                stream=ijson is not None,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            if ijson is not None:
+                return _iter_json_items(response, 'results.item')
+            return json_loads(response.content).get('results', [])
+        except requests.exceptions.RequestException as e:
+            click.echo(f'[ERROR] Error running AQL query: {e}', err=True)
+            raise
+    
+    def _iter_aql(self, query: str, repo: str, path: str, page: Iterable[dict], verbose: bool) -> Iterator[dict]:
+        """Yield the files of a paged AQL query, fetching pages as needed.
+
+        Parameters
+        ----------
+        query : str
+            Sorted AQL query without offset and limit.
+        repo : str
+            Queried repository name.
+        path : str
+            Queried path, stripped of slashes.
+        page : Iterable[dict]
+            Results of the first page.
+        verbose : bool
+            Enable verbose logging.
+
+        Yields
+        ------
+        dict
+            File metadata dictionary.
 
         Raises
         ------
         requests.exceptions.RequestException
-            If all retries fail.
+            If API request fails.
         """
-        last_exception = None
-        for attempt in range(self.retries):
-            try:
-                response = self.session.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < self.retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
-                    time.sleep(wait_time)
-        raise last_exception
-    
-    def __enter__(self):
-        """Context manager entry."""
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close session."""
-        self.session.close()
-        return False
+        count = 0
+        while True:
+            page_count = 0
+            for item in page:
+                page_count += 1
+                item_path = item.get('path', '.')
+                full_path = item['name'] if item_path == '.' else f'{item_path}/{item["name"]}'
+                rel_path = full_path[len(path) + 1:] if path else full_path
+                yield {
+                    'uri': f'/{rel_path}',
+                    'size': item.get('size'),
+                    'sha1': item.get('actual_sha1'),
+                    'sha2': item.get('sha256')
+                }
+            # A capped page can be shorter than requested, so only an empty
+            # page marks the end
+            if not page_count:
+                break
+            count += page_count
+            page = self._aql_page(query, count)
+        
+        if verbose:
+            click.echo(f'[AQL] Found {count} files in {repo}/{path}')
     
-    def list_artifacts(self, repo: str, path: str = '', verbose: bool = False) -> list[dict]:
-        """List artifacts in a repository path.
+    def list_files(self, repo: str, path: str = '', verbose: bool = False) -> list[dict] | _SpooledListing:
+        """List every file below a repository path.
+
+        Uses AQL when enabled for this client and falls back to the File
+        List API if the query is rejected, e.g. on servers without AQL.
+        Streamed listings are read to the end before returning, so the
+        connection is not held open while files are transferred.
 
         Parameters
         ----------
@@ -140,152 +1398,167 @@ class ArtifactoryClient:
 
         Returns
         -------
-        list[dict]
-            List of artifact metadata dictionaries from Artifactory API.
+        list[dict] or _SpooledListing
+            File metadata dictionaries. Each ``uri`` is relative to
+            ``path`` and starts with ``/``.
 
         Raises
         ------
         requests.exceptions.RequestException
             If API request fails.
+        OSError
+            If a streamed listing cannot be spooled to disk.
         """
-        path = path.lstrip('/')
-        url = f'{self.base_url}/api/repository/{repo}'
-        if path:
-            url = f'{url}/{path}'
-        
-        try:
-            if verbose:
-                click.echo(f'[LIST] Querying repository: {url}')
-            
-            response = self._retry_request(
-                'GET',
-                url,
-                params={'list': '1', 'deep': '1', 'listFolders': '1'},
-                timeout=self.timeout
-            )
-            data = response.json()
-            results = data.get('results', [])
-            
-            if verbose:
-                click.echo(f'[LIST] Found {len(results)} items')
-            
-            return results
-        except requests.exceptions.RequestException as e:
-            click.echo(f'[ERROR] Error listing artifacts: {e}', err=True)
-            raise
+        if self.use_aql:
+            try:
+                return _SpooledListing(self.aql_find(repo, path, verbose))
+            except requests.exceptions.RequestException:
+                click.echo('⚠ AQL listing failed, falling back to the file list API', err=True)
+        files = self.list_artifacts_deep(repo, path, verbose)
+        return files if isinstance(files, list) else _SpooledListing(files)
     
-    def download_file(self, repo: str, artifact_path: str, local_path: Path, verbose: bool = False) -> bool:
-        """Download a single artifact from Artifactory.
+    def server_copy(
+        self,
+        src_repo: str,
+        src_path: str,
+        dest_repo: str,
+        dest_path: str,
+        dry_run: bool = False,
+        verbose: bool = False
+    ) -> bool:
+        """Copy artifacts within this Artifactory instance on the server side.
+
+        Uses the Copy Item API so no artifact bytes pass through the client.
 
         Parameters
         ----------
-        repo : str
-            Repository name.
-        artifact_path : str
-            Path to artifact in repository.
-        local_path : Path
-            Local path to save downloaded file.
+        src_repo : str
+            Source repository name.
+        src_path : str
+            Source path in repository. Defaults to the repository root if empty.
+        dest_repo : str
+            Destination repository name.
+        dest_path : str
+            Destination path in repository. Defaults to the repository root if empty.
+        dry_run : bool, optional
+            If True, ask the server to validate the copy without performing it.
+            Default is False.
         verbose : bool, optional
             Enable verbose logging. Default is False.
 
         Returns
         -------
         bool
-            True if download successful, False otherwise.
+            True if copy successful (or would be in dry run), False otherwise.
         """
-        artifact_path = artifact_path.lstrip('/')
-        url = f'{self.base_url}/{repo}'
-        if artifact_path:
-            url = f'{url}/{artifact_path}'
+        src_path = src_path.strip('/')
+        dest_path = dest_path.strip('/')
+        url = f'{self.base_url}/api/copy/{src_repo}'
+        if src_path:
+            url = f'{url}/{src_path}'
+        target = f'/{dest_repo}/{dest_path}' if dest_path else f'/{dest_repo}'
         
         try:
             if verbose:
-                click.echo(f'[DOWNLOAD] Fetching from: {url}')
-            
-            response = self._retry_request('GET', url, stream=True, timeout=self.timeout)
+                click.echo(f'[COPY] Server-side copy: {url} -> {target}')
             
-            # Create parent directories if needed
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            if verbose:
-                content_length = response.headers.get('content-length', 'unknown')
-                click.echo(f'[DOWNLOAD] File size: {content_length} bytes')
-            
-            # Download file
-            bytes_written = 0
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        bytes_written += len(chunk)
+            response = self.session.request(
+                'POST',
+                url,
+                params={'to': target, 'dry': '1' if dry_run else '0'},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
             
             if verbose:
-                click.echo(f'[DOWNLOAD] Successfully saved to: {local_path} ({bytes_written} bytes)')
+                for message in response.json().get('messages', []):
+                    click.echo(f'[COPY] {message.get("level", "INFO")}: {message.get("message", "")}')
             
             return True
-        except requests.exceptions.RequestException as e:
-            click.echo(f'[ERROR] Error downloading {artifact_path}: {e}', err=True)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            click.echo(f'[ERROR] Error during server-side copy: {e}', err=True)
             return False
     
-    def upload_file(self, repo: str, artifact_path: str, local_path: Path, dry_run: bool = False, verbose: bool = False) -> bool:
-        """Upload a file to Artifactory.
+    def replicate_to(
+        self,
+        repo: str,
+        path: str,
+        target_url: str,
+        username: str,
+        password: str,
+        verbose: bool = False
+    ) -> bool:
+        """Push a repository path to another Artifactory instance.
+
+        Uses the Replication API so the source server transfers the
+        artifacts directly to the target. The replication runs
+        asynchronously on the server.
 
         Parameters
         ----------
         repo : str
-            Repository name.
-        artifact_path : str
-            Target path in repository.
-        local_path : Path
-            Local file path to upload.
-        dry_run : bool, optional
-            If True, simulate upload without actually uploading.
-            Default is False.
+            Source repository name.
+        path : str
+            Source path in repository. Defaults to the repository root if empty.
+        target_url : str
+            Full URL of the target repository path.
+            Example: https://backup.example.com/artifactory/repo/path
+        username : str
+            Username for the target Artifactory server.
+        password : str
+            Password for the target Artifactory server.
         verbose : bool, optional
             Enable verbose logging. Default is False.
 
         Returns
         -------
         bool
-            True if upload successful or would be successful in dry run,
-            False otherwise.
+            True if replication was accepted, False otherwise.
         """
-        artifact_path = artifact_path.lstrip('/')
-        url = f'{self.base_url}/{repo}'
-        if artifact_path:
-            url = f'{url}/{artifact_path}'
+        path = path.strip('/')
+        url = f'{self.base_url}/api/replication/execute/{repo}'
+        if path:
+            url = f'{url}/{path}'
         
         try:
-            if dry_run:
-                file_size = local_path.stat().st_size
-                click.echo(f'[DRY-RUN] Would upload to: {url} ({file_size} bytes)')
-                if verbose:
-                    click.echo(f'[DRY-RUN] Source file: {local_path}')
-                return True
-            
-            file_size = local_path.stat().st_size
-            if verbose:
-                click.echo(f'[UPLOAD] Uploading to: {url}')
-                click.echo(f'[UPLOAD] File size: {file_size} bytes')
-            
-            with open(local_path, 'rb') as f:
-                response = self._retry_request('PUT', url, data=f, timeout=self.timeout)
-            
             if verbose:
-                click.echo(f'[UPLOAD] Successfully uploaded: {artifact_path}')
+                click.echo(f'[REPLICATION] Pushing {url} -> {target_url}')
             
+            response = self.session.post(
+                url,
+                json=[{
+                    'url': target_url,
+                    'username': username,
+                    'password': password,
+                    'properties': True,
+                    'delete': False
+                }],
+                timeout=self.timeout
+            )
+            response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            click.echo(f'[ERROR] Error uploading {artifact_path}: {e}', err=True)
+            click.echo(f'[ERROR] Error triggering replication: {e}', err=True)
             return False
 
 
 class JFrogCLIClient:
     """Client for interacting with Artifactory using JFrog CLI."""
     
-    def __init__(self, base_url: str, username: str, password: str):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        server_id: str = 'artifactory-sync',
+        threads: int = DEFAULT_MAX_WORKERS
+    ):
         """Initialize JFrog CLI client.
 
+        Registers the server with ``jf config add`` once, so later commands
+        refer to it by ``--server-id`` and credentials never appear in their
+        arguments.
+
         Parameters
         ----------
         base_url : str
@@ -294,12 +1567,43 @@ class JFrogCLIClient:
             Artifactory username.
         password : str
             Artifactory password.
+        server_id : str, optional
+            JFrog CLI server ID to register. Default is 'artifactory-sync'.
+        threads : int, optional
+            Worker threads used by bulk transfers. Default is DEFAULT_MAX_WORKERS.
+
+        Raises
+        ------
+        RuntimeError
+            If the server configuration cannot be added.
         """
         self.base_url = base_url.rstrip('/')
         self.username = username
-        self.password = password
+        self.server_id = server_id
+        self.threads = threads
+        
+        command = [
+            'jf',
+            'config',
+            'add',
+            self.server_id,
+            f'--artifactory-url={self.base_url}',
+            f'--user={self.username}',
+            '--password-stdin',
+            '--interactive=false',
+            '--overwrite'
+        ]
+        success, output, errors = self._run_command(command, stdin=password)
+        if not success:
+            raise RuntimeError(f"Failed to configure JFrog CLI server: {errors or output}")
     
-    def _run_command(self, command: list, verbose: bool = False, display_command: list = None) -> tuple[bool, str]:
+    def _run_command(
+        self,
+        command: list,
+        verbose: bool = False,
+        timeout: float | None = 300,
+        stdin: str | None = None
+    ) -> tuple[bool, str, str]:
         """Execute a jf CLI command.
 
         Parameters
@@ -308,47 +1612,52 @@ class JFrogCLIClient:
             Command and arguments to execute.
         verbose : bool, optional
             Enable verbose logging. Default is False.
-        display_command : list, optional
-            Command to display in verbose output (e.g., without password).
-            If not provided, command is used.
+        timeout : float or None, optional
+            Seconds to wait for the command. None waits indefinitely.
+            Default is 300.
+        stdin : str, optional
+            Data passed to the command's standard input.
 
         Returns
         -------
-        tuple[bool, str]
-            Tuple of (success, output).
+        tuple[bool, str, str]
+            Tuple of (success, stdout, stderr). Standard output is returned
+            even if the command fails, since jf prints its transfer summary
+            there.
         """
         try:
             if verbose:
-                cmd_to_display = display_command if display_command else command
-                click.echo(f'[JFROG] Running: {" ".join(cmd_to_display)}')
+                click.echo(f'[JFROG] Running: {" ".join(command)}')
             
             result = subprocess.run(
                 command,
+                input=stdin,
                 capture_output=True,
                 text=True,
-                timeout=300
+                timeout=timeout
             )
             
-            if result.returncode == 0:
-                return True, result.stdout
-            else:
-                error_msg = result.stderr or result.stdout
-                if verbose:
-                    click.echo(f'[JFROG] Error: {error_msg}', err=True)
-                return False, error_msg
+            if result.returncode != 0 and verbose:
+                click.echo(f'[JFROG] Error: {result.stderr or result.stdout}', err=True)
+            return result.returncode == 0, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
-            return False, "Command timed out"
+            return False, '', "Command timed out"
         except Exception as e:
-            return False, str(e)
+            return False, '', str(e)
     
     def __enter__(self):
         """Context manager entry."""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit - remove the server configuration."""
+        self.close()
         return False
     
+    def close(self) -> None:
+        """Remove the server configuration, including its credentials."""
+        self._run_command(['jf', 'config', 'remove', self.server_id, '--quiet'])
+    
     def list_artifacts(self, repo: str, path: str = '', verbose: bool = False) -> list[dict]:
         """List artifacts in a repository path using jfrog CLI.
 
@@ -379,29 +1688,16 @@ class JFrogCLIClient:
             'rt',
             'search',
             pattern,
-            f'--url={self.base_url}',
-            f'--user={self.username}',
-            f'--password={self.password}',
-            '--format=json'
-        ]
-        
-        display_command = [
-            'jf',
-            'rt',
-            'search',
-            pattern,
-            f'--url={self.base_url}',
-            f'--user={self.username}',
-            '--password=***',
+            f'--server-id={self.server_id}',
             '--format=json'
         ]
         
-        success, output = self._run_command(command, verbose, display_command)
+        success, output, errors = self._run_command(command, verbose)
         if not success:
-            raise RuntimeError(f"Failed to list artifacts: {output}")
+            raise RuntimeError(f"Failed to list artifacts: {errors or output}")
         
         try:
-            data = json.loads(output)
+            data = json_loads(output)
             results = data.get('results', [])
             
             if verbose:
@@ -413,77 +1709,105 @@ class JFrogCLIClient:
                 click.echo(f'[JFROG] No artifacts found or empty result')
             return []
     
-    def download_file(self, repo: str, artifact_path: str, local_path: Path, verbose: bool = False) -> bool:
-        """Download a single artifact using jfrog CLI.
+    def bulk_transfer(self, action: str, spec: dict, dry_run: bool = False, verbose: bool = False) -> tuple[int, int]:
+        """Run a single jf download or upload for a whole file spec.
+
+        One ``jf`` invocation transfers every file matched by the spec using
+        the CLI's own worker threads, instead of one process per file.
+
+        Parameters
+        ----------
+        action : str
+            ``'download'`` or ``'upload'``.
+        spec : dict
+            JFrog CLI file spec, e.g. ``{'files': [{'pattern': ..., 'target': ...}]}``.
+        dry_run : bool, optional
+            If True, pass ``--dry-run`` so nothing is transferred. Default is False.
+        verbose : bool, optional
+            Enable verbose logging. Default is False.
+
+        Returns
+        -------
+        tuple[int, int]
+            Tuple of (successful_transfers, failed_transfers) from the jf summary.
+
+        Raises
+        ------
+        RuntimeError
+            If the command fails without reporting a transfer summary.
+        """
+        with tempfile.TemporaryDirectory() as spec_dir:
+            spec_path = Path(spec_dir) / 'filespec.json'
+            spec_path.write_text(json.dumps(spec))
+            
+            command = [
+                'jf',
+                'rt',
+                action,
+                f'--spec={spec_path}',
+                f'--threads={self.threads}',
+                f'--server-id={self.server_id}'
+            ]
+            
+            if dry_run:
+                command.append('--dry-run')
+            
+            if verbose:
+                click.echo(f'[JFROG] Bulk {action} spec: {json.dumps(spec)}')
+            
+            success, output, errors = self._run_command(command, verbose, timeout=None)
+        
+        # jf exits non-zero when any file fails, but still prints its summary
+        try:
+            totals = json.loads(output[output.index('{'):])['totals']
+            return int(totals.get('success', 0)), int(totals.get('failure', 0))
+        except (ValueError, KeyError, TypeError):
+            if not success:
+                raise RuntimeError(f"Bulk {action} failed: {errors or output}")
+            return 0, 0
+    
+    def bulk_download(self, repo: str, path: str, local_dir: Path, verbose: bool = False) -> tuple[int, int]:
+        """Download every file below a repository path with one jf call.
 
         Parameters
         ----------
         repo : str
             Repository name.
-        artifact_path : str
-            Path to artifact in repository.
-        local_path : Path
-            Local path to save downloaded file.
+        path : str
+            Path within repository. Defaults to root if empty.
+        local_dir : Path
+            Local directory to save artifacts, relative to ``path``.
         verbose : bool, optional
             Enable verbose logging. Default is False.
 
         Returns
         -------
-        bool
-            True if download successful, False otherwise.
+        tuple[int, int]
+            Tuple of (successful_downloads, failed_downloads).
         """
-        artifact_path = artifact_path.lstrip('/')
-        source_path = f'{repo}/{artifact_path}'
-        
-        # Create parent directories if needed
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        command = [
-            'jf',
-            'rt',
-            'download',
-            source_path,
-            str(local_path),
-            f'--url={self.base_url}',
-            f'--user={self.username}',
-            f'--password={self.password}'
-        ]
-        
-        display_command = [
-            'jf',
-            'rt',
-            'download',
-            source_path,
-            str(local_path),
-            f'--url={self.base_url}',
-            f'--user={self.username}',
-            '--password=***'
-        ]
-        
-        if verbose:
-            click.echo(f'[JFROG] Downloading from: {source_path}')
-        
-        success, output = self._run_command(command, verbose, display_command)
-        
-        if success:
-            if verbose:
-                click.echo(f'[JFROG] Successfully saved to: {local_path}')
-            return True
-        else:
-            click.echo(f'[ERROR] Error downloading {artifact_path}: {output}', err=True)
-            return False
+        path = path.strip('/')
+        pattern = f'{repo}/{path}/(*)' if path else f'{repo}/(*)'
+        spec = {'files': [{'pattern': pattern, 'target': f'{local_dir.as_posix()}/{{1}}', 'flat': 'true'}]}
+        return self.bulk_transfer('download', spec, verbose=verbose)
     
-    def upload_file(self, repo: str, artifact_path: str, local_path: Path, dry_run: bool = False, verbose: bool = False) -> bool:
-        """Upload a file using jfrog CLI.
+    def bulk_upload(
+        self,
+        local_dir: Path,
+        repo: str,
+        path: str,
+        dry_run: bool = False,
+        verbose: bool = False
+    ) -> tuple[int, int]:
+        """Upload every file below a local directory with one jf call.
 
         Parameters
         ----------
+        local_dir : Path
+            Local directory containing artifacts.
         repo : str
             Repository name.
-        artifact_path : str
-            Target path in repository.
-        local_path : Path
-            Local file path to upload.
+        path : str
+            Target path in repository. Defaults to root if empty.
         dry_run : bool, optional
             If True, simulate upload without actually uploading. Default is False.
         verbose : bool, optional
@@ -491,59 +1815,284 @@ class JFrogCLIClient:
 
         Returns
         -------
-        bool
-            True if upload successful or would be successful in dry run, False otherwise.
+        tuple[int, int]
+            Tuple of (successful_uploads, failed_uploads).
+        """
+        path = path.strip('/')
+        target = f'{repo}/{path}/{{1}}' if path else f'{repo}/{{1}}'
+        spec = {'files': [{'pattern': f'{local_dir.as_posix()}/(*)', 'target': target, 'flat': 'true'}]}
+        return self.bulk_transfer('upload', spec, dry_run, verbose)
+
+
+class Manifest:
+    """Record of completed transfers used to resume an interrupted sync.
+
+    Every completed artifact is appended to a JSON Lines state file and
+    flushed immediately, so progress survives a crash or ``Ctrl-C``. A
+    later run loading the same file skips artifacts already uploaded with
+    the same checksum.
+    """
+    
+    def __init__(self, path: Path):
+        """Initialize an empty manifest.
+
+        Parameters
+        ----------
+        path : Path
+            State file that completions are appended to.
+        """
+        self.path = Path(path)
+        self._entries = {}
+        self._file = None
+        # Uploads complete on several worker threads
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: Path) -> 'Manifest':
+        """Load a manifest from its state file and open it for appending.
+
+        A missing file gives an empty manifest. Unparseable lines, such as
+        one cut short by an interrupted run, are ignored.
+
+        Parameters
+        ----------
+        path : Path
+            State file to read and append to.
+
+        Returns
+        -------
+        Manifest
+            Manifest holding the latest record of each artifact.
+
+        Raises
+        ------
+        OSError
+            If the state file cannot be read or opened for appending.
         """
-        artifact_path = artifact_path.lstrip('/')
-        target_path = f'{repo}/{artifact_path}'
+        manifest = cls(path)
+        # Set when the file ends in a line cut short by an interrupted run
+        partial_line = False
+        try:
+            with open(manifest.path, 'rb') as f:
+                for line in f:
+                    partial_line = not line.endswith(b'\n')
+                    try:
+                        record = json_loads(line)
+                        manifest._entries[(record['repo'], record['path'])] = record
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
         
+        # Fail at startup rather than on every completion
         try:
-            file_size = local_path.stat().st_size
-            
-            if dry_run:
-                click.echo(f'[DRY-RUN] Would upload to: {target_path} ({file_size} bytes)')
-                if verbose:
-                    click.echo(f'[DRY-RUN] Source file: {local_path}')
-                return True
-            
-            if verbose:
-                click.echo(f'[JFROG] Uploading to: {target_path}')
-                click.echo(f'[JFROG] File size: {file_size} bytes')
-            
-            command = [
-                'jf',
-                'rt',
-                'upload',
-                str(local_path),
-                target_path,
-                f'--url={self.base_url}',
-                f'--user={self.username}',
-                f'--password={self.password}'
-            ]
-            
-            display_command = [
-                'jf',
-                'rt',
-                'upload',
-                str(local_path),
-                target_path,
-                f'--url={self.base_url}',
-                f'--user={self.username}',
-                '--password=***'
-            ]
-            
-            success, output = self._run_command(command, verbose, display_command)
-            
-            if success:
-                if verbose:
-                    click.echo(f'[JFROG] Successfully uploaded: {artifact_path}')
-                return True
-            else:
-                click.echo(f'[ERROR] Error uploading {artifact_path}: {output}', err=True)
-                return False
+            manifest._file = open(manifest.path, 'a', encoding='utf-8')
+            if partial_line:
+                manifest._file.write('\n')
         except OSError as e:
-            click.echo(f'[ERROR] Error uploading {artifact_path}: {e}', err=True)
+            raise OSError(f'Could not open state file {manifest.path}: {e.strerror or e}') from e
+        return manifest
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close the state file."""
+        self.close()
+    
+    def is_done(self, repo: str, artifact_path: str, sha256: str | None = None) -> bool:
+        """Check whether an artifact was already uploaded.
+
+        Parameters
+        ----------
+        repo : str
+            Destination repository name.
+        artifact_path : str
+            Path to artifact in destination repository.
+        sha256 : str, optional
+            Current SHA-256 of the source artifact. If given, the artifact
+            only counts as done if it was uploaded with this checksum.
+
+        Returns
+        -------
+        bool
+            True if the latest record marks the artifact as uploaded.
+        """
+        record = self._entries.get((repo, artifact_path))
+        if not record or record.get('status') != 'uploaded':
             return False
+        return not sha256 or record.get('sha256') == sha256
+    
+    def mark(
+        self,
+        repo: str,
+        artifact_path: str,
+        status: str,
+        sha256: str | None = None,
+        size: int | None = None
+    ) -> None:
+        """Record the status of an artifact and flush it to the state file.
+
+        Parameters
+        ----------
+        repo : str
+            Destination repository name.
+        artifact_path : str
+            Path to artifact in destination repository.
+        status : str
+            Transfer status, e.g. ``'uploaded'``.
+        sha256 : str, optional
+            SHA-256 checksum of the transferred content.
+        size : int, optional
+            Size of the artifact in bytes.
+        """
+        record = {
+            'repo': repo,
+            'path': artifact_path,
+            'status': status,
+            'sha256': sha256,
+            'size': int(size) if size is not None else None,
+            'ts': time.time()
+        }
+        with self._lock:
+            self._entries[(repo, artifact_path)] = record
+            if self._file is None:
+                return
+            try:
+                self._file.write(json.dumps(record) + '\n')
+                self._file.flush()
+            except OSError as e:
+                logger.warning('[STATE] Could not write state file %s: %s', self.path, e)
+    
+    def close(self) -> None:
+        """Close the state file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _iter_files(root: str) -> Iterator[tuple[os.DirEntry, str]]:
+    """Yield all regular files below a directory.
+
+    Walks the tree once with ``os.scandir``, so file types come from the
+    directory entries without an extra ``stat`` call per entry. The entries
+    are yielded as-is, so callers get the file size from the entry's cached
+    ``stat`` instead of stating the path again. Relative paths are built
+    while descending instead of with ``os.path.relpath``, and an explicit
+    stack avoids chaining one generator per directory level.
+
+    Parameters
+    ----------
+    root : str
+        Directory to walk.
+
+    Yields
+    ------
+    tuple[os.DirEntry, str]
+        Directory entry of each file and its path relative to ``root``,
+        using ``/`` as separator.
+    """
+    stack = [(root, '')]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f'{prefix}{entry.name}/'))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, prefix + entry.name
+
+
+@contextmanager
+def _transfer_pool(max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """Run a thread pool that drops its queued calls if the caller fails.
+
+    A plain ``with ThreadPoolExecutor()`` waits for every submitted call
+    on exit, so an error or Ctrl-C would still run all queued transfers
+    without their results being recorded.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of worker threads.
+
+    Yields
+    ------
+    ThreadPoolExecutor
+        Executor shut down when the block exits.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield executor
+    except BaseException:
+        executor.shutdown(cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def _run_bounded(
+    executor: Executor,
+    calls: Iterable[tuple[object, Callable, tuple]],
+    limit: int
+) -> Iterator[tuple[object, object]]:
+    """Run calls on an executor with a bounded number of them in flight.
+
+    ``calls`` is consumed lazily, so a large listing is never fully
+    materialized as futures.
+
+    Parameters
+    ----------
+    executor : Executor
+        Executor running the calls.
+    calls : Iterable[tuple[object, Callable, tuple]]
+        ``(key, fn, args)`` tuples; ``fn(*args)`` is submitted for each.
+    limit : int
+        Maximum number of submitted calls not yet collected.
+
+    Yields
+    ------
+    tuple[object, object]
+        ``(key, result)`` for each call, in completion order.
+    """
+    in_flight = {}
+    for key, fn, args in calls:
+        if len(in_flight) >= limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future.result()
+        in_flight[executor.submit(fn, *args)] = key
+    for future in as_completed(in_flight):
+        yield in_flight[future], future.result()
+
+
+def _filter_listing(
+    artifacts: Iterable[dict],
+    skip: Callable[[dict], bool] | None
+) -> list[dict] | _SpooledListing:
+    """Drop the artifacts that need no transfer from a listing.
+
+    ``skip`` is called exactly once per artifact, and the result knows its
+    length, so progress bars get an exact total.
+
+    Parameters
+    ----------
+    artifacts : Iterable[dict]
+        Listing returned by ``list_files``.
+    skip : Callable[[dict], bool], optional
+        Predicate returning True for artifacts that will not be transferred.
+
+    Returns
+    -------
+    list[dict] or _SpooledListing
+        Artifacts to transfer; a list if ``artifacts`` is one, spooled to
+        disk otherwise.
+    """
+    if skip is None and isinstance(artifacts, (list, _SpooledListing)):
+        return artifacts
+    kept = (artifact for artifact in artifacts if not (skip and skip(artifact)))
+    return list(kept) if isinstance(artifacts, list) else _SpooledListing(kept)
 
 
 def download_artifacts_recursively(
@@ -551,10 +2100,21 @@ def download_artifacts_recursively(
     repo: str,
     src_path: str,
     local_dir: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    skip: Callable[[dict], bool] | None = None,
+    artifacts: Iterable[dict] | None = None,
+    dest_client: ArtifactoryClient | None = None,
+    dest_repo: str = '',
+    dest_path: str = '',
+    check_dest: bool = False
 ) -> tuple[int, int]:
     """Recursively download artifacts from Artifactory.
 
+    The whole subtree is listed with a single listing call; the
+    files are then downloaded concurrently by a bounded thread pool.
+    Files are saved under ``local_dir`` relative to ``src_path``.
+
     Parameters
     ----------
     client : ArtifactoryClient
@@ -567,6 +2127,25 @@ def download_artifacts_recursively(
         Local directory to save artifacts.
     verbose : bool, optional
         Enable verbose output. Default is False.
+    max_workers : int, optional
+        Maximum number of concurrent downloads. Default is DEFAULT_MAX_WORKERS.
+    skip : Callable[[dict], bool], optional
+        Predicate called once with each listed artifact before transfers start;
+        artifacts it returns True for are not downloaded.
+    artifacts : Iterable[dict], optional
+        Source listing from ``list_files`` if already fetched; listed here
+        otherwise.
+    dest_client : ArtifactoryClient, optional
+        Destination ArtifactoryClient instance, used with ``check_dest``.
+    dest_repo : str, optional
+        Destination repository name, used with ``check_dest``.
+    dest_path : str, optional
+        Destination path in repository, used with ``check_dest``.
+    check_dest : bool, optional
+        If True, look up each artifact at the destination before
+        downloading it and skip it when its SHA-256 matches the source
+        listing. Useful when ``skip`` could not be computed up front.
+        Default is False.
 
     Returns
     -------
@@ -575,49 +2154,62 @@ def download_artifacts_recursively(
     """
     success_count = 0
     fail_count = 0
+    unchanged_count = 0
+    src_path = src_path.strip('/')
+    dest_path = dest_path.strip('/')
+    src_display = src_path if src_path else '/'
+    
+    def download(
+        artifact_path: str,
+        local_file: Path,
+        rel_path: str,
+        sha256: str | None,
+        size: int | None
+    ) -> str | bool | None:
+        # None means the artifact is unchanged at the destination
+        if check_dest and sha256:
+            dest_artifact_path = f'{dest_path}/{rel_path}' if dest_path else rel_path
+            if _dest_unchanged(dest_client, dest_repo, dest_artifact_path, sha256):
+                logger.debug('[SKIP] Unchanged at destination: %s', dest_artifact_path)
+                return None
+        return client.download_file(repo, artifact_path, local_file, size) or False
     
     try:
         if verbose:
-            src_display = src_path if src_path else '/'
             click.echo(f'[RECURSIVE] Starting download from: {repo}/{src_display}')
         
-        artifacts = client.list_artifacts(repo, src_path, verbose)
-        
-        if not artifacts:
-            if verbose:
-                src_display = src_path if src_path else '/'
-                click.echo(f'[RECURSIVE] No artifacts found at: {repo}/{src_display}')
-            return success_count, fail_count
+        if artifacts is None:
+            artifacts = client.list_files(repo, src_path, verbose)
+        artifacts = _filter_listing(artifacts, skip)
         
-        for artifact in artifacts:
-            artifact_path = artifact.get('uri', '').lstrip('/')
-            
-            if artifact.get('folder', False):
-                # Recursively download folder
-                if verbose:
-                    click.echo(f'[RECURSIVE] Entering folder: {artifact_path}')
-                sub_success, sub_fail = download_artifacts_recursively(
-                    client, repo, artifact_path, local_dir, verbose
+        def calls():
+            for artifact in artifacts:
+                rel_path = artifact.get('uri', '').lstrip('/')
+                artifact_path = f'{src_path}/{rel_path}' if src_path else rel_path
+                logger.debug('[FILE] Processing file: %s', artifact_path)
+                yield artifact_path, download, (
+                    artifact_path, local_dir / rel_path, rel_path, artifact.get('sha2'), artifact.get('size')
                 )
-                success_count += sub_success
-                fail_count += sub_fail
-            else:
-                # Download file
-                local_file = local_dir / artifact_path
-                if verbose:
-                    click.echo(f'[FILE] Processing file: {artifact_path}')
-                
-                if client.download_file(repo, artifact_path, local_file, verbose):
+        
+        with _transfer_pool(max_workers) as executor:
+            for artifact_path, digest in _run_bounded(executor, calls(), PENDING_PER_WORKER * max_workers):
+                if digest is None:
+                    unchanged_count += 1
+                elif digest:
                     success_count += 1
-                    if verbose:
-                        click.echo(f'[SUCCESS] File downloaded: {artifact_path}')
+                    logger.debug('[SUCCESS] File downloaded: %s', artifact_path)
                 else:
                     fail_count += 1
-    except (requests.exceptions.RequestException, OSError) as e:
+        
+        if unchanged_count:
+            click.echo(f'✓ Skipped {unchanged_count} unchanged artifacts')
+        
+        if not success_count + fail_count + unchanged_count and verbose:
+            click.echo(f'[RECURSIVE] No artifacts found at: {repo}/{src_display}')
+    except (requests.exceptions.RequestException, RuntimeError, OSError) as e:
         click.echo(f'[ERROR] Error during recursive download: {e}', err=True)
     
     if verbose:
-        src_display = src_path if src_path else '/'
         click.echo(f'[RECURSIVE] Download complete from: {repo}/{src_display} (Success: {success_count}, Failed: {fail_count})')
     
     return success_count, fail_count
@@ -630,10 +2222,19 @@ def upload_artifacts_recursively(
     local_dir: Path,
     dry_run: bool = False,
     verbose: bool = False,
-    overwrite: bool = True
+    overwrite: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    batch: bool = False,
+    manifest: Manifest | None = None
 ) -> tuple[int, int]:
     """Recursively upload artifacts to Artifactory.
 
+    The local tree is streamed into a bounded thread pool as it is walked,
+    so no file list is built and uploads start immediately. With ``batch``,
+    small files are grouped into tar archives that the server explodes,
+    turning many round trips into one; an archive that is rejected is
+    uploaded file by file instead.
+
     Parameters
     ----------
     client : ArtifactoryClient
@@ -651,6 +2252,14 @@ def upload_artifacts_recursively(
         Enable verbose output. Default is False.
     overwrite : bool, optional
         If True, overwrite existing files. Default is True.
+    max_workers : int, optional
+        Maximum number of concurrent uploads. Default is DEFAULT_MAX_WORKERS.
+    batch : bool, optional
+        If True, upload small files in tar archives. Ignored for dry runs.
+        Default is False.
+    manifest : Manifest, optional
+        Manifest to record each uploaded file, including archive members,
+        in. Dry runs record nothing.
 
     Returns
     -------
@@ -659,49 +2268,99 @@ def upload_artifacts_recursively(
     """
     success_count = 0
     fail_count = 0
-    dest_path = dest_path.rstrip('/')
+    dest_path = dest_path.strip('/')
+    batch = batch and not dry_run
     
     if verbose:
         mode = "DRY-RUN" if dry_run else "UPLOAD"
         dest_display = dest_path if dest_path else '/'
         click.echo(f'[{mode}] Starting {mode.lower()} to: {repo}/{dest_display}')
     
-    # Use generator for memory efficiency with large repos
-    def file_generator():
-        """Generate all files in directory."""
-        return (f for f in local_dir.rglob('*') if f.is_file())
+    def artifact_path_of(rel_path: str) -> str:
+        # Construct artifact path, handling empty dest_path
+        return f'{dest_path}/{rel_path}' if dest_path else rel_path
     
-    files_list = list(file_generator())
-    total_files = len(files_list)
+    record = manifest if not dry_run else None
     
-    if verbose:
-        click.echo(f'[COUNT] Found {total_files} files to process')
-    
-    # Use tqdm for progress bar (always show unless very quiet mode)
-    with tqdm(files_list, disable=dry_run or verbose, desc='Uploading', unit='file') as pbar:
-        for local_file in pbar:
-            # Calculate relative path and target artifact path
-            rel_path = local_file.relative_to(local_dir)
-            rel_path_str = str(rel_path).replace('\\', '/')
-            
-            # Construct artifact path, handling empty dest_path
-            if dest_path:
-                artifact_path = f'{dest_path}/{rel_path_str}'
-            else:
-                artifact_path = rel_path_str
+    def sha256_of(local_file: Path) -> str:
+        with open(local_file, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+    
+    def upload_one(artifact_path: str, local_file: Path, size: int | None = None) -> list[bool]:
+        # Hashed here rather than in upload_file so the manifest gets the digest
+        sha256 = sha256_of(local_file) if record else None
+        uploaded = client.upload_file(repo, artifact_path, local_file, dry_run, sha256, size)
+        if uploaded and record:
+            record.mark(repo, artifact_path, 'uploaded', sha256, size)
+        return [uploaded]
+    
+    def upload_batch(files: list[tuple[Path, str, int]], name: str) -> list[bool]:
+        members = [(local_file, rel_path) for local_file, rel_path, _ in files]
+        if client.upload_archive(repo, dest_path, members, name):
+            if record:
+                for local_file, rel_path, size in files:
+                    record.mark(repo, artifact_path_of(rel_path), 'uploaded', sha256_of(local_file), size)
+            return [True] * len(files)
+        click.echo(f'⚠ Archive upload failed, uploading its {len(files)} files one by one', err=True)
+        return [
+            upload_one(artifact_path_of(rel_path), local_file, size)[0]
+            for local_file, rel_path, size in files
+        ]
+    
+    def calls():
+        # Small files waiting to be uploaded together in one archive
+        small_files = []
+        archive_count = 0
+        # The tree is walked once and never counted up front
+        for index, (entry, rel_path_str) in enumerate(_iter_files(str(local_dir)), 1):
+            artifact_path = artifact_path_of(rel_path_str)
+            logger.debug('[PROGRESS] [%d] Processing: %s', index, artifact_path)
             
-            if verbose:
-                click.echo(f'[PROGRESS] Processing: {artifact_path}')
+            # One stat per file, cached on the entry
+            size = entry.stat(follow_symlinks=False).st_size
+            if not batch or size >= CHECKSUM_DEPLOY_MIN_BYTES:
+                yield [artifact_path], upload_one, (artifact_path, Path(entry.path), size)
+                continue
             
-            if client.upload_file(repo, artifact_path, local_file, dry_run, verbose):
-                success_count += 1
-                if verbose and not dry_run:
-                    click.echo(f'[SUCCESS] File uploaded: {artifact_path}')
-                elif verbose and dry_run:
-                    click.echo(f'[DRY-RUN] Would upload: {artifact_path}')
-            else:
-                fail_count += 1
-                click.echo(f'[FAILED] Could not upload: {artifact_path}', err=True)
+            small_files.append((Path(entry.path), rel_path_str, size))
+            if len(small_files) >= BATCH_MAX_FILES:
+                archive_count += 1
+                yield [artifact_path_of(rel) for _, rel, _ in small_files], upload_batch, (
+                    small_files, f'artifactory-sync-{os.getpid()}-{archive_count}.tar'
+                )
+                small_files = []
+        
+        if len(small_files) >= BATCH_MIN_FILES:
+            archive_count += 1
+            yield [artifact_path_of(rel) for _, rel, _ in small_files], upload_batch, (
+                small_files, f'artifactory-sync-{os.getpid()}-{archive_count}.tar'
+            )
+        else:
+            for local_file, rel_path_str, size in small_files:
+                artifact_path = artifact_path_of(rel_path_str)
+                yield [artifact_path], upload_one, (artifact_path, local_file, size)
+    
+    with _transfer_pool(max_workers) as executor:
+        # Use tqdm for progress bar (always show unless very quiet mode)
+        with tqdm(
+            disable=dry_run or verbose,
+            desc='Uploading',
+            unit='file',
+            mininterval=0.5,
+            smoothing=0.05
+        ) as pbar:
+            for artifact_paths, results in _run_bounded(executor, calls(), PENDING_PER_WORKER * max_workers):
+                for artifact_path, uploaded in zip(artifact_paths, results):
+                    if uploaded:
+                        success_count += 1
+                        if dry_run:
+                            logger.debug('[DRY-RUN] Would upload: %s', artifact_path)
+                        else:
+                            logger.debug('[SUCCESS] File uploaded: %s', artifact_path)
+                    else:
+                        fail_count += 1
+                        click.echo(f'[FAILED] Could not upload: {artifact_path}', err=True)
+                pbar.update(len(results))
     
     mode = "DRY-RUN" if dry_run else "UPLOAD"
     dest_display = dest_path if dest_path else '/'
@@ -711,6 +2370,451 @@ def upload_artifacts_recursively(
     return success_count, fail_count
 
 
+def sync_artifacts_recursively(
+    src_client: ArtifactoryClient,
+    src_repo: str,
+    src_path: str,
+    dest_client: ArtifactoryClient,
+    dest_repo: str,
+    dest_path: str,
+    verbose: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    skip: Callable[[dict], bool] | None = None,
+    artifacts: Iterable[dict] | None = None,
+    manifest: Manifest | None = None,
+    check_dest: bool = False
+) -> tuple[int, int]:
+    """Recursively stream artifacts from source to destination.
+
+    The source subtree is listed once and every file is piped to the
+    destination by ``ArtifactoryClient.pipe_to`` on a bounded thread pool,
+    without a local temporary copy.
+
+    Parameters
+    ----------
+    src_client : ArtifactoryClient
+        Source ArtifactoryClient instance.
+    src_repo : str
+        Source repository name.
+    src_path : str
+        Source path in repository.
+    dest_client : ArtifactoryClient
+        Destination ArtifactoryClient instance.
+    dest_repo : str
+        Destination repository name.
+    dest_path : str
+        Destination path in repository.
+    verbose : bool, optional
+        Enable verbose output. Default is False.
+    max_workers : int, optional
+        Maximum number of concurrent transfers. Default is DEFAULT_MAX_WORKERS.
+    skip : Callable[[dict], bool], optional
+        Predicate called once with each listed artifact before transfers start;
+        artifacts it returns True for are not transferred.
+    artifacts : Iterable[dict], optional
+        Source listing from ``list_files`` if already fetched; listed here
+        otherwise.
+    manifest : Manifest, optional
+        Manifest to record each completed transfer in.
+    check_dest : bool, optional
+        If True, look up each artifact at the destination before
+        transferring it and skip it when its SHA-256 matches the source
+        listing. Useful when ``skip`` could not be computed up front.
+        Default is False.
+
+    Returns
+    -------
+    tuple[int, int]
+        Tuple of (successful_transfers, failed_transfers).
+    """
+    success_count = 0
+    fail_count = 0
+    unchanged_count = 0
+    src_path = src_path.strip('/')
+    dest_path = dest_path.strip('/')
+    
+    try:
+        if artifacts is None:
+            artifacts = src_client.list_files(src_repo, src_path, verbose)
+        artifacts = _filter_listing(artifacts, skip)
+    except requests.exceptions.RequestException as e:
+        click.echo(f'[ERROR] Error during recursive sync: {e}', err=True)
+        return success_count, fail_count
+    
+    def transfer(src_artifact_path: str, dest_artifact_path: str, sha256: str | None, size: int) -> bool | None:
+        # None means the artifact is unchanged at the destination
+        if check_dest and sha256 and _dest_unchanged(dest_client, dest_repo, dest_artifact_path, sha256):
+            logger.debug('[SKIP] Unchanged at destination: %s', dest_artifact_path)
+            return None
+        return src_client.pipe_to(
+            src_repo,
+            src_artifact_path,
+            dest_client,
+            dest_repo,
+            dest_artifact_path,
+            sha256 if size >= CHECKSUM_DEPLOY_MIN_BYTES else None
+        )
+    
+    def calls():
+        for artifact in artifacts:
+            rel_path = artifact.get('uri', '').lstrip('/')
+            src_artifact_path = f'{src_path}/{rel_path}' if src_path else rel_path
+            dest_artifact_path = f'{dest_path}/{rel_path}' if dest_path else rel_path
+            yield (dest_artifact_path, artifact), transfer, (
+                src_artifact_path, dest_artifact_path, artifact.get('sha2'), int(artifact.get('size') or 0)
+            )
+    
+    with _transfer_pool(max_workers) as executor:
+        with tqdm(
+            _run_bounded(executor, calls(), PENDING_PER_WORKER * max_workers),
+            total=len(artifacts),
+            disable=verbose,
+            desc='Syncing',
+            unit='file',
+            mininterval=0.5,
+            smoothing=0.05
+        ) as pbar:
+            for (artifact_path, artifact), synced in pbar:
+                if synced is None:
+                    unchanged_count += 1
+                elif synced:
+                    success_count += 1
+                    if manifest:
+                        manifest.mark(
+                            dest_repo, artifact_path, 'uploaded', artifact.get('sha2'), artifact.get('size')
+                        )
+                else:
+                    fail_count += 1
+                    click.echo(f'[FAILED] Could not sync: {artifact_path}', err=True)
+    
+    if unchanged_count:
+        click.echo(f'✓ Skipped {unchanged_count} unchanged artifacts')
+    
+    if verbose:
+        src_display = src_path if src_path else '/'
+        click.echo(f'[SYNC] Sync complete from: {src_repo}/{src_display} (Success: {success_count}, Failed: {fail_count})')
+    
+    return success_count, fail_count
+
+
+def pipeline_artifacts_recursively(
+    src_client: ArtifactoryClient,
+    src_repo: str,
+    src_path: str,
+    dest_client: ArtifactoryClient,
+    dest_repo: str,
+    dest_path: str,
+    local_dir: Path,
+    dry_run: bool = False,
+    verbose: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    skip: Callable[[dict], bool] | None = None,
+    keep_files: bool = False,
+    check_dest: bool = False,
+    artifacts: Iterable[dict] | None = None,
+    manifest: Manifest | None = None
+) -> tuple[int, int, int, int]:
+    """Download and upload artifacts through a local directory concurrently.
+
+    Downloaded files are handed to the uploaders through a bounded queue,
+    so uploads start as soon as the first file arrives and at most a few
+    files per worker wait on disk at any time. Each file is deleted once
+    uploaded unless ``keep_files`` is set.
+
+    Parameters
+    ----------
+    src_client : ArtifactoryClient
+        Source ArtifactoryClient instance.
+    src_repo : str
+        Source repository name.
+    src_path : str
+        Source path in repository.
+    dest_client : ArtifactoryClient
+        Destination ArtifactoryClient instance.
+    dest_repo : str
+        Destination repository name.
+    dest_path : str
+        Destination path in repository.
+    local_dir : Path
+        Local directory for downloaded files, relative to ``src_path``.
+    dry_run : bool, optional
+        If True, simulate uploads without actually uploading.
+        Default is False.
+    verbose : bool, optional
+        Enable verbose output. Default is False.
+    max_workers : int, optional
+        Number of download and of upload workers. Default is DEFAULT_MAX_WORKERS.
+    skip : Callable[[dict], bool], optional
+        Predicate called once with each listed artifact before transfers start;
+        artifacts it returns True for are not transferred.
+    keep_files : bool, optional
+        If True, leave uploaded files in ``local_dir``. Default is False.
+    check_dest : bool, optional
+        If True, look up each artifact at the destination before
+        downloading it and skip it when its SHA-256 matches the source
+        listing. Useful when ``skip`` could not be computed up front.
+        Default is False.
+    artifacts : Iterable[dict], optional
+        Source listing from ``list_files`` if already fetched; listed here
+        otherwise.
+    manifest : Manifest, optional
+        Manifest to record each completed upload in. Dry runs record
+        nothing.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        Tuple of (successful_downloads, failed_downloads,
+        successful_uploads, failed_uploads).
+    """
+    download_success = download_fail = unchanged_count = 0
+    src_path = src_path.strip('/')
+    dest_path = dest_path.strip('/')
+    # Downloaded files waiting for an uploader; None tells an uploader to stop
+    pending = queue.Queue(maxsize=2 * max_workers)
+    
+    def download(
+        artifact_path: str,
+        local_file: Path,
+        dest_artifact_path: str,
+        sha256: str | None,
+        size: int | None
+    ) -> bool | None:
+        # None means the artifact is unchanged at the destination
+        if check_dest and sha256 and _dest_unchanged(dest_client, dest_repo, dest_artifact_path, sha256):
+            logger.debug('[SKIP] Unchanged at destination: %s', dest_artifact_path)
+            return None
+        digest = src_client.download_file(src_repo, artifact_path, local_file, size)
+        if not digest:
+            return False
+        pending.put((local_file, dest_artifact_path, digest, size))
+        return True
+    
+    def upload() -> tuple[int, int]:
+        success_count = fail_count = 0
+        while (item := pending.get()) is not None:
+            local_file, artifact_path, digest, size = item
+            if dest_client.upload_file(dest_repo, artifact_path, local_file, dry_run, digest):
+                success_count += 1
+                logger.debug('[SUCCESS] File uploaded: %s', artifact_path)
+                if manifest and not dry_run:
+                    manifest.mark(dest_repo, artifact_path, 'uploaded', digest, size)
+            else:
+                fail_count += 1
+                click.echo(f'[FAILED] Could not upload: {artifact_path}', err=True)
+            if not keep_files:
+                local_file.unlink(missing_ok=True)
+        return success_count, fail_count
+    
+    with _transfer_pool(max_workers) as uploaders:
+        upload_futures = [uploaders.submit(upload) for _ in range(max_workers)]
+        try:
+            if artifacts is None:
+                artifacts = src_client.list_files(src_repo, src_path, verbose)
+            artifacts = _filter_listing(artifacts, skip)
+            
+            def calls():
+                for artifact in artifacts:
+                    rel_path = artifact.get('uri', '').lstrip('/')
+                    artifact_path = f'{src_path}/{rel_path}' if src_path else rel_path
+                    dest_artifact_path = f'{dest_path}/{rel_path}' if dest_path else rel_path
+                    yield artifact_path, download, (
+                        artifact_path,
+                        local_dir / rel_path,
+                        dest_artifact_path,
+                        artifact.get('sha2'),
+                        artifact.get('size')
+                    )
+            
+            with _transfer_pool(max_workers) as downloaders:
+                with tqdm(
+                    _run_bounded(downloaders, calls(), PENDING_PER_WORKER * max_workers),
+                    total=len(artifacts),
+                    disable=verbose,
+                    desc='Transferring',
+                    unit='file',
+                    mininterval=0.5,
+                    smoothing=0.05
+                ) as pbar:
+                    for _, result in pbar:
+                        if result is None:
+                            unchanged_count += 1
+                        elif result:
+                            download_success += 1
+                        else:
+                            download_fail += 1
+                
+                if unchanged_count:
+                    click.echo(f'✓ Skipped {unchanged_count} unchanged artifacts')
+        except requests.exceptions.RequestException as e:
+            click.echo(f'[ERROR] Error during pipelined transfer: {e}', err=True)
+        finally:
+            for _ in upload_futures:
+                pending.put(None)
+        
+        upload_success = upload_fail = 0
+        for future in upload_futures:
+            success_count, fail_count = future.result()
+            upload_success += success_count
+            upload_fail += fail_count
+    
+    return download_success, download_fail, upload_success, upload_fail
+
+
+def _dest_checksums(
+    dest_client: ArtifactoryClient,
+    dest_repo: str,
+    dest_path: str,
+    verbose: bool = False
+) -> dict[str, dict] | None:
+    """Fetch the checksums of every file below a destination path.
+
+    The destination side is fetched with one AQL query, so the source
+    listing can be compared against it in memory instead of looking up
+    each file.
+
+    Parameters
+    ----------
+    dest_client : ArtifactoryClient
+        Destination ArtifactoryClient instance.
+    dest_repo : str
+        Destination repository name.
+    dest_path : str
+        Destination path in repository.
+    verbose : bool, optional
+        Enable verbose output. Default is False.
+
+    Returns
+    -------
+    dict[str, dict] or None
+        File metadata from ``aql_find`` keyed by ``uri``, or None if the
+        AQL query fails.
+    """
+    try:
+        return {item['uri']: item for item in dest_client.aql_find(dest_repo, dest_path, verbose)}
+    except requests.exceptions.RequestException:
+        return None
+
+
+class _SkipFilter:
+    """Predicate selecting listed artifacts that need no transfer.
+
+    Passed as ``skip`` to the transfer functions, which call it once on
+    each listed artifact while spooling the source listing, so the listing
+    never has to be held in memory. Skipped artifacts are counted for
+    reporting.
+    """
+    
+    def __init__(
+        self,
+        dest_repo: str,
+        dest_path: str,
+        dest_files: dict[str, dict] | None = None,
+        manifest: Manifest | None = None
+    ):
+        """Initialize the filter.
+
+        Parameters
+        ----------
+        dest_repo : str
+            Destination repository name.
+        dest_path : str
+            Destination path in repository.
+        dest_files : dict[str, dict], optional
+            Destination listing from ``_dest_checksums``. Artifacts whose
+            SHA-256 (or SHA-1, if a side lacks SHA-256) matches it are
+            skipped.
+        manifest : Manifest, optional
+            Artifacts it records as uploaded with the same SHA-256 are
+            skipped.
+        """
+        self.dest_repo = dest_repo
+        self.dest_path = dest_path.strip('/')
+        self.dest_files = dest_files
+        self.manifest = manifest
+        self.unchanged = 0
+        self.resumed = 0
+    
+    def __call__(self, artifact: dict) -> bool:
+        """Check whether a listed artifact can be skipped.
+
+        Parameters
+        ----------
+        artifact : dict
+            Source file metadata from ``list_files``.
+
+        Returns
+        -------
+        bool
+            True if the artifact is unchanged at the destination or was
+            uploaded by a previous run.
+        """
+        uri = artifact.get('uri', '')
+        rel_path = uri.lstrip('/')
+        dest_item = self.dest_files.get(uri) if self.dest_files else None
+        if dest_item:
+            key = 'sha2' if artifact.get('sha2') and dest_item.get('sha2') else 'sha1'
+            if artifact.get(key) and artifact[key] == dest_item.get(key):
+                self.unchanged += 1
+                return True
+        if self.manifest:
+            dest_artifact_path = f'{self.dest_path}/{rel_path}' if self.dest_path else rel_path
+            if self.manifest.is_done(self.dest_repo, dest_artifact_path, artifact.get('sha2')):
+                self.resumed += 1
+                return True
+        return False
+
+
+def _dest_unchanged(dest_client: ArtifactoryClient, dest_repo: str, dest_path: str, sha256: str) -> bool:
+    """Check whether an artifact already exists at the destination with a given SHA-256.
+
+    Parameters
+    ----------
+    dest_client : ArtifactoryClient
+        Destination ArtifactoryClient instance.
+    dest_repo : str
+        Destination repository name.
+    dest_path : str
+        Path to artifact in destination repository.
+    sha256 : str
+        Expected SHA-256 checksum.
+
+    Returns
+    -------
+    bool
+        True if the destination file exists with that checksum; False if it
+        differs, is missing or cannot be looked up.
+    """
+    try:
+        info = dest_client.stat(dest_repo, dest_path)
+    except requests.exceptions.RequestException:
+        return False
+    return bool(info) and info.get('checksums', {}).get('sha256') == sha256
+
+
+def _same_instance(source_url: str, dest_url: str) -> bool:
+    """Check whether two base URLs point at the same Artifactory instance.
+
+    Parameters
+    ----------
+    source_url : str
+        Source Artifactory base URL.
+    dest_url : str
+        Destination Artifactory base URL.
+
+    Returns
+    -------
+    bool
+        True if host, port and context path match.
+    """
+    source = urlparse(source_url)
+    dest = urlparse(dest_url)
+    return (
+        source.netloc.lower() == dest.netloc.lower()
+        and source.path.rstrip('/') == dest.path.rstrip('/')
+    )
+
+
 @click.command()
 @click.option(
     '--source-url',
@@ -763,6 +2867,55 @@ def upload_artifacts_recursively(
     default=True,
     help='Overwrite existing files in destination (default: True)'
 )
+@click.option(
+    '--skip-unchanged/--no-skip-unchanged',
+    default=True,
+    help='Skip artifacts whose checksum already matches at the destination (default: enabled)'
+)
+@click.option(
+    '--aql/--no-aql',
+    default=True,
+    help='List the source with a single AQL query; --no-aql uses the file list API instead (default: enabled)'
+)
+@click.option(
+    '--listing-cache/--no-listing-cache',
+    default=True,
+    help=f'Cache source listings by ETag in {LISTING_CACHE_DIR} (default: enabled)'
+)
+@click.option(
+    '--pipeline/--no-pipeline',
+    default=True,
+    help='Upload files from the temporary directory while downloads are still running (default: enabled)'
+)
+@click.option(
+    '--batch-uploads/--no-batch-uploads',
+    default=False,
+    help='Upload files under 64 KiB in tar archives the destination explodes; '
+         'stages everything before uploading (default: disabled)'
+)
+@click.option(
+    '--compress-uploads',
+    is_flag=True,
+    help='Gzip-encode uploads of text-like files (only if the destination decodes gzip request bodies)'
+)
+@click.option(
+    '--parallelism',
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    help=f'Number of artifacts transferred concurrently (default: {DEFAULT_MAX_WORKERS})'
+)
+@click.option(
+    '--download-streams',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Parallel range requests per download of files of 64 MiB or more when staging locally (default: 1)'
+)
+@click.option(
+    '--state-file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help='JSON Lines file recording completed transfers; rerunning with the same file skips them (default: none)'
+)
 @click.option(
     '--validate',
     is_flag=True,
@@ -773,6 +2926,11 @@ def upload_artifacts_recursively(
     is_flag=True,
     help='Use JFrog CLI for Artifactory operations instead of REST API'
 )
+@click.option(
+    '--use-replication',
+    is_flag=True,
+    help='Have the source server push artifacts to the destination via the Replication API'
+)
 def sync_artifacts(
     source_url: str,
     source_repo: str,
@@ -784,8 +2942,18 @@ def sync_artifacts(
     dry_run: bool,
     keep_temp: bool,
     overwrite: bool,
+    skip_unchanged: bool,
+    aql: bool,
+    listing_cache: bool,
+    pipeline: bool,
+    batch_uploads: bool,
+    compress_uploads: bool,
+    parallelism: int,
+    download_streams: int,
+    state_file: Path | None,
     validate: bool,
-    use_jfrog_cli: bool
+    use_jfrog_cli: bool,
+    use_replication: bool
 ):
     """Sync artifacts from source Artifactory to destination Artifactory.
 
@@ -822,6 +2990,15 @@ def sync_artifacts(
         )
         sys.exit(1)
     
+    # Per-file progress goes through logging so it costs nothing unless verbose.
+    # Records are queued and written by a background thread, so transfer
+    # workers never wait on each other for stderr.
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(format='%(message)s', handlers=[logging.handlers.QueueHandler(log_queue)])
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    log_listener.start()
+    
     try:
         # Initialize clients
         click.echo('=' * 60)
@@ -835,18 +3012,74 @@ def sync_artifacts(
             click.echo(f'[CONFIG] Destination: {dest_url}/{dest_repo}/{dest_path}')
             click.echo(f'[CONFIG] Dry Run: {dry_run}')
             click.echo(f'[CONFIG] Overwrite: {overwrite}')
+            click.echo(f'[CONFIG] Skip unchanged: {skip_unchanged}')
+            click.echo(f'[CONFIG] Parallelism: {parallelism}')
+        
+        # Completed transfers are recorded so an interrupted run can resume
+        if state_file and use_jfrog_cli:
+            click.echo('⚠ --state-file is not supported with --use-jfrog-cli and will be ignored', err=True)
+            state_file = None
+        manifest_obj = Manifest.load(state_file) if state_file else nullcontext()
         
         click.echo(f'Initializing Artifactory clients ({client_type})...')
         
         # Create appropriate client type
         if use_jfrog_cli:
-            source_client_obj = JFrogCLIClient(source_url, source_username, source_password)
-            dest_client_obj = JFrogCLIClient(dest_url, dest_username, dest_password)
+            # Server IDs are per process, since jf keeps them in the user's global config
+            source_client_obj = JFrogCLIClient(
+                source_url,
+                source_username,
+                source_password,
+                f'artifactory-sync-source-{os.getpid()}',
+                parallelism
+            )
+            try:
+                dest_client_obj = JFrogCLIClient(
+                    dest_url,
+                    dest_username,
+                    dest_password,
+                    f'artifactory-sync-dest-{os.getpid()}',
+                    parallelism
+                )
+            except BaseException:
+                # The with block that would remove the source entry never starts
+                source_client_obj.close()
+                raise
         else:
-            source_client_obj = ArtifactoryClient(source_url, source_username, source_password)
-            dest_client_obj = ArtifactoryClient(dest_url, dest_username, dest_password)
+            # Clients of the same server share one pool of warm connections
+            source_parts = urlparse(source_url)
+            dest_parts = urlparse(dest_url)
+            same_host = (source_parts.scheme, source_parts.netloc.lower()) == (
+                dest_parts.scheme, dest_parts.netloc.lower()
+            )
+            # A worker holds a destination connection plus one source connection
+            # per download stream
+            adapter = (
+                ArtifactoryClient.create_adapter(pool_size=parallelism * (download_streams + 1))
+                if same_host else None
+            )
+            
+            source_client_obj = ArtifactoryClient(
+                source_url,
+                source_username,
+                source_password,
+                cache_dir=LISTING_CACHE_DIR if listing_cache else None,
+                adapter=adapter,
+                # Each ranged download holds one connection per stream
+                pool_size=parallelism * download_streams,
+                use_aql=aql,
+                download_streams=download_streams
+            )
+            dest_client_obj = ArtifactoryClient(
+                dest_url,
+                dest_username,
+                dest_password,
+                compress_uploads=compress_uploads,
+                adapter=adapter,
+                pool_size=parallelism
+            )
         
-        with source_client_obj as source_client, dest_client_obj as dest_client:
+        with source_client_obj as source_client, dest_client_obj as dest_client, manifest_obj as manifest:
             
             if verbose:
                 click.echo('[CLIENT] Source client initialized')
@@ -870,72 +3103,209 @@ def sync_artifacts(
                     click.echo(f'✗ Destination connection failed: {e}', err=True)
                     sys.exit(1)
             
-            # Create temporary directory for downloads
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                if verbose:
-                    click.echo(f'[TEMP] Temporary directory created: {temp_path}')
-                
-                # Download from source
+            transferred = False
+            src_display = source_path if source_path else '/'
+            dest_display = dest_path if dest_path else '/'
+            
+            if not (use_jfrog_cli or keep_temp) and _same_instance(source_url, dest_url):
+                # Both repositories live on one server: copy without moving bytes
                 click.echo('-' * 60)
-                src_display = source_path if source_path else '/'
-                click.echo(f'Downloading artifacts from {source_repo}{src_display}...')
+                click.echo(f'Copying artifacts server-side from {source_repo}{src_display} to {dest_repo}{dest_display}...')
                 click.echo('-' * 60)
                 
-                download_success, download_fail = download_artifacts_recursively(
-                    source_client,
-                    source_repo,
-                    source_path,
-                    temp_path,
-                    verbose
+                transferred = source_client.server_copy(
+                    source_repo, source_path, dest_repo, dest_path, dry_run, verbose
                 )
-                total_downloaded = download_success + download_fail
-                click.echo(f'✓ Downloaded {download_success}/{total_downloaded} artifacts')
-                if download_fail > 0:
-                    click.echo(f'⚠ {download_fail} downloads failed', err=True)
+                if transferred:
+                    click.echo('✓ DRY-RUN: Server-side copy validated' if dry_run else '✓ Server-side copy completed')
+                else:
+                    click.echo('⚠ Server-side copy failed, falling back to client-side transfer', err=True)
+            elif use_replication and not (use_jfrog_cli or dry_run or keep_temp):
+                click.echo('-' * 60)
+                click.echo(f'Replicating artifacts from {source_repo}{src_display} to {dest_repo}{dest_display}...')
+                click.echo('-' * 60)
                 
-                # Upload to destination
+                target_url = f'{dest_client.base_url}/{dest_repo}/{dest_path.strip("/")}'.rstrip('/')
+                transferred = source_client.replicate_to(
+                    source_repo, source_path, target_url, dest_username, dest_password, verbose
+                )
+                if transferred:
+                    click.echo('✓ Replication triggered on source server')
+                else:
+                    click.echo('⚠ Replication failed, falling back to client-side transfer', err=True)
+            
+            skip = None
+            check_dest = False
+            if (skip_unchanged or manifest) and not transferred and not use_jfrog_cli:
+                # The source listing is filtered while it streams into the transfer
+                dest_files = None
+                if skip_unchanged:
+                    dest_files = _dest_checksums(dest_client, dest_repo, dest_path, verbose)
+                    if dest_files is None:
+                        # Look each artifact up at the destination instead
+                        click.echo('⚠ Could not compare checksums in bulk, checking artifacts individually', err=True)
+                        check_dest = True
+                skip = _SkipFilter(dest_repo, dest_path, dest_files, manifest)
+            
+            if not transferred and not (use_jfrog_cli or dry_run or keep_temp or batch_uploads):
+                # Stream each artifact straight from source to destination
                 click.echo('-' * 60)
-                dest_display = dest_path if dest_path else '/'
-                mode = "DRY-RUN: Simulating upload" if dry_run else f'Uploading artifacts to {dest_repo}{dest_display}'
-                click.echo(mode + '...')
+                click.echo(f'Streaming artifacts from {source_repo}{src_display} to {dest_repo}{dest_display}...')
                 click.echo('-' * 60)
                 
-                upload_success, upload_fail = upload_artifacts_recursively(
+                sync_success, sync_fail = sync_artifacts_recursively(
+                    source_client,
+                    source_repo,
+                    source_path,
                     dest_client,
                     dest_repo,
                     dest_path,
-                    temp_path,
-                    dry_run,
                     verbose,
-                    overwrite
+                    max_workers=parallelism,
+                    skip=skip,
+                    manifest=manifest,
+                    check_dest=check_dest
                 )
-                total_uploaded = upload_success + upload_fail
-                
-                if dry_run:
-                    click.echo(f'✓ DRY-RUN: Would upload {upload_success}/{total_uploaded} artifacts')
-                else:
-                    click.echo(f'✓ Uploaded {upload_success}/{total_uploaded} artifacts')
-                if upload_fail > 0:
-                    click.echo(f'⚠ {upload_fail} uploads failed', err=True)
-                
-                # Keep temp directory if requested
-                if keep_temp:
-                    keep_dir = Path.cwd() / 'artifactory_temp'
-                    shutil.copytree(temp_path, keep_dir, dirs_exist_ok=True)
-                    click.echo(f'[TEMP] Temporary files kept in: {keep_dir}')
+                total_synced = sync_success + sync_fail
+                click.echo(f'✓ Synced {sync_success}/{total_synced} artifacts')
+                if sync_fail > 0:
+                    click.echo(f'⚠ {sync_fail} transfers failed', err=True)
+            elif not transferred and pipeline and not (use_jfrog_cli or batch_uploads):
+                # Upload each file from the temporary directory as soon as it is downloaded
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    temp_path = Path(temp_dir)
+                    
+                    click.echo('-' * 60)
+                    mode = 'DRY-RUN: Downloading and simulating upload of' if dry_run else 'Transferring'
+                    click.echo(f'{mode} artifacts from {source_repo}{src_display} to {dest_repo}{dest_display}...')
+                    click.echo('-' * 60)
+                    
+                    download_success, download_fail, upload_success, upload_fail = pipeline_artifacts_recursively(
+                        source_client,
+                        source_repo,
+                        source_path,
+                        dest_client,
+                        dest_repo,
+                        dest_path,
+                        temp_path,
+                        dry_run,
+                        verbose,
+                        max_workers=parallelism,
+                        skip=skip,
+                        keep_files=keep_temp,
+                        check_dest=check_dest,
+                        manifest=manifest
+                    )
+                    total_downloaded = download_success + download_fail
+                    click.echo(f'✓ Downloaded {download_success}/{total_downloaded} artifacts')
+                    if download_fail > 0:
+                        click.echo(f'⚠ {download_fail} downloads failed', err=True)
+                    
+                    if dry_run:
+                        click.echo(f'✓ DRY-RUN: Would upload {upload_success}/{download_success} artifacts')
+                    else:
+                        click.echo(f'✓ Uploaded {upload_success}/{download_success} artifacts')
+                    if upload_fail > 0:
+                        click.echo(f'⚠ {upload_fail} uploads failed', err=True)
+                    
+                    if keep_temp:
+                        keep_dir = Path.cwd() / 'artifactory_temp'
+                        shutil.copytree(temp_path, keep_dir, dirs_exist_ok=True)
+                        click.echo(f'[TEMP] Temporary files kept in: {keep_dir}')
+            elif not transferred:
+                # Create temporary directory for downloads
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    temp_path = Path(temp_dir)
+                    
+                    if verbose:
+                        click.echo(f'[TEMP] Temporary directory created: {temp_path}')
+                    
+                    # Download from source
+                    click.echo('-' * 60)
+                    src_display = source_path if source_path else '/'
+                    click.echo(f'Downloading artifacts from {source_repo}{src_display}...')
+                    click.echo('-' * 60)
+                    
+                    if use_jfrog_cli:
+                        download_success, download_fail = source_client.bulk_download(
+                            source_repo, source_path, temp_path, verbose
+                        )
+                    else:
+                        download_success, download_fail = download_artifacts_recursively(
+                            source_client,
+                            source_repo,
+                            source_path,
+                            temp_path,
+                            verbose,
+                            max_workers=parallelism,
+                            skip=skip,
+                            dest_client=dest_client,
+                            dest_repo=dest_repo,
+                            dest_path=dest_path,
+                            check_dest=check_dest
+                        )
+                    total_downloaded = download_success + download_fail
+                    click.echo(f'✓ Downloaded {download_success}/{total_downloaded} artifacts')
+                    if download_fail > 0:
+                        click.echo(f'⚠ {download_fail} downloads failed', err=True)
+                    
+                    # Upload to destination
+                    click.echo('-' * 60)
+                    dest_display = dest_path if dest_path else '/'
+                    mode = "DRY-RUN: Simulating upload" if dry_run else f'Uploading artifacts to {dest_repo}{dest_display}'
+                    click.echo(mode + '...')
+                    click.echo('-' * 60)
+                    
+                    if use_jfrog_cli:
+                        upload_success, upload_fail = dest_client.bulk_upload(
+                            temp_path, dest_repo, dest_path, dry_run, verbose
+                        )
+                    else:
+                        upload_success, upload_fail = upload_artifacts_recursively(
+                            dest_client,
+                            dest_repo,
+                            dest_path,
+                            temp_path,
+                            dry_run,
+                            verbose,
+                            overwrite,
+                            max_workers=parallelism,
+                            batch=batch_uploads,
+                            manifest=manifest
+                        )
+                    total_uploaded = upload_success + upload_fail
+                    
+                    if dry_run:
+                        click.echo(f'✓ DRY-RUN: Would upload {upload_success}/{total_uploaded} artifacts')
+                    else:
+                        click.echo(f'✓ Uploaded {upload_success}/{total_uploaded} artifacts')
+                    if upload_fail > 0:
+                        click.echo(f'⚠ {upload_fail} uploads failed', err=True)
+                    
+                    # Keep temp directory if requested
+                    if keep_temp:
+                        keep_dir = Path.cwd() / 'artifactory_temp'
+                        shutil.copytree(temp_path, keep_dir, dirs_exist_ok=True)
+                        click.echo(f'[TEMP] Temporary files kept in: {keep_dir}')
+            
+            if skip and skip.unchanged:
+                click.echo(f'✓ Skipped {skip.unchanged} unchanged artifacts')
+            if skip and skip.resumed:
+                click.echo(f'✓ Skipped {skip.resumed} artifacts completed by a previous run')
         
         click.echo('-' * 60)
         click.echo('✓ Sync completed successfully')
         click.echo('=' * 60)
     
-    except (requests.exceptions.RequestException, OSError) as e:
+    except (requests.exceptions.RequestException, RuntimeError, OSError) as e:
         click.echo(f'[ERROR] {e}', err=True)
         sys.exit(1)
     except KeyboardInterrupt:
         click.echo('\n[ERROR] Operation cancelled by user', err=True)
         sys.exit(1)
+    finally:
+        # Flush queued log records before exiting
+        log_listener.stop()
 
 
 if __name__ == '__main__':